@@ -782,7 +782,7 @@ class DatabasePage(QWidget):
                                                 f"Are you sure you want to delete {len(self.selected_images)} images?",
                                                 QMessageBox.Yes | QMessageBox.No)
             if confirmation == QMessageBox.Yes:
-                deleted_images = []
+                deleted_images = set()
                 for image_id in self.selected_images:
                     image_data = self.db_helper.fetch_image_path_by_id(image_id)
 
@@ -796,9 +796,10 @@ class DatabasePage(QWidget):
                         if os.path.exists(thumbnail_path):
                             os.remove(thumbnail_path)
 
-                        self.db_helper.delete_image(image_id)
-                        deleted_images.append(image_id)
+                        deleted_images.add(image_id)
 
+                # Remove all rows in one transaction rather than committing once per image.
+                self.db_helper.delete_images_bulk(list(deleted_images))
                 self.selected_images.clear()
 
                 self.in_delete_mode = False
@@ -1,19 +1,27 @@
 import multiprocessing
 import random
-import tempfile
+import re
 import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
 from datetime import datetime
 import os
+import shutil
 import zipfile
 from dotenv import load_dotenv
 import boto3
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+import pytz
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QObject, QRunnable, QThreadPool
 from PyQt5 import QtWidgets
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QGridLayout, QFrame, QPushButton, QMessageBox, QHBoxLayout, \
-    QProgressBar, QSizePolicy, QTreeWidgetItem, QDialog, QCheckBox, QFileDialog, QComboBox
+    QProgressBar, QSizePolicy, QTreeWidgetItem, QDialog, QCheckBox, QFileDialog, QComboBox, QProgressDialog
 from PyQt5.QtGui import QPixmap
+from botocore.config import Config
 from botocore.exceptions import NoCredentialsError
+from sqlalchemy import delete, insert
 from sqlalchemy.orm import sessionmaker
 from PIL import Image
 import io
@@ -21,10 +29,10 @@ import io
 from app.databases import model, conn
 from app.databases.model import Photo
 from app.util.database_helper import DatabaseHelper
-from app.databases.conn import OnlineDatabase
+from app.databases.conn import get_online_database
 
 load_dotenv()
-connection = OnlineDatabase()
+connection = get_online_database()
 
 # Drop all tables in the online database (if necessary) and recreate them.
 # This might be part of initialization or a migration step.
@@ -38,11 +46,34 @@ access_secret_key = os.getenv('AWS_SECRET_ACCESS_KEY')
 # Set up a session using SQLAlchemy for database interactions.
 Session = sessionmaker(bind=conn.engine)
 
+# Maximum number of S3 uploads in flight at once during a sync.
+UPLOAD_CONCURRENCY = 8
+
+# Shared pool for fetching images from S3 in parallel when downloading or saving selections.
+s3_pool = ThreadPoolExecutor(max_workers=32)
+
+# S3 client settings: a connection pool large enough for the parallel fetch pools to reuse warm
+# connections, adaptive retries and virtual-hosted addressing.
+s3_config = Config(max_pool_connections=64,
+                   retries={'max_attempts': 5, 'mode': 'adaptive'},
+                   tcp_keepalive=True,
+                   s3={'addressing_style': 'virtual'})
+
+# Extracts the S3 key portion from a stored image URL.
+S3_KEY_PATTERN = re.compile(r'app/detection_model/temporary_detected_(.+)$')
+
+# Objects larger than one part are fetched as parallel byte ranges on their own pool, so that
+# ranged fetches started from s3_pool workers never wait on s3_pool itself.
+RANGE_PART_SIZE = 8 * 1024 * 1024
+range_pool = ThreadPoolExecutor(max_workers=8)
+
 
 class UploadThread(QThread):
     """Thread class for handling image upload to S3 and database synchronization in the background."""
     # Signal to update progress in a GUI application.
     progress_updated = pyqtSignal(int, str)
+    # Signal carrying (group_name, created_at, thumbnail) tuples for the photos added by this run.
+    photos_added = pyqtSignal(list)
 
     def __init__(self, current_user):
         super().__init__()
@@ -52,7 +83,7 @@ class UploadThread(QThread):
         # Initialize an S3 client using the AWS credentials.
         self.s3_client = boto3.client('s3', aws_access_key_id=access_key_id,
                                       aws_secret_access_key=access_secret_key,
-                                      region_name='ap-southeast-2')
+                                      region_name='ap-southeast-2', config=s3_config)
         # The S3 bucket name where images will be uploaded.
         self.bucket_name = 'carewebbucket'
 
@@ -69,6 +100,27 @@ class UploadThread(QThread):
             print("S3 Credentials not available")
             return None
 
+    def upload_image_files(self, image):
+        """Upload the bounding box, cropped and thumbnail files of one image to S3.
+
+        Args:
+            image (ImageRow): The local image record whose files are uploaded.
+
+        Returns:
+            tuple: The (bbox, cropped, thumbnail) S3 URLs, any of which is None if its upload failed,
+                followed by the (bbox, cropped, thumbnail) S3 keys.
+        """
+        # Prepare S3 keys (file paths in the S3 bucket) for each image type.
+        bbox_s3_key = f"images/bbox/{os.path.basename(image.bbox_image_path)}"
+        cropped_s3_key = f"images/cropped/{os.path.basename(image.cropped_image_path)}"
+        thumbnail_s3_key = f"images/thumbnails/{os.path.basename(image.thumbnail_path)}"
+
+        # Upload each image to S3 and retrieve their URLs.
+        bbox_s3_url = self.upload_to_s3(image.bbox_image_path, bbox_s3_key)
+        cropped_s3_url = self.upload_to_s3(image.cropped_image_path, cropped_s3_key)
+        thumbnail_s3_url = self.upload_to_s3(image.thumbnail_path, thumbnail_s3_key)
+        return bbox_s3_url, cropped_s3_url, thumbnail_s3_url, bbox_s3_key, cropped_s3_key, thumbnail_s3_key
+
     def run(self):
         """The main method executed when the thread is run."""
         # Create a new database session for this thread.
@@ -82,78 +134,93 @@ class UploadThread(QThread):
             total_images = len(unsynced_images)
             print(f"Found {total_images} unsynced images. Starting upload...")
             start_time = time.time()
-
-            # Iterate over each unsynced image and upload it to S3.
-            for idx, image in enumerate(unsynced_images):
-                is_synced = image[9]
-
-                if not is_synced:
-                    # print(f"Uploading unsynced image ID {image[0]}...")
-
-                    user = connection.get_user_id(self.current_user)
-                    bbox_image_path = image[2]  # Local path to the bounding box image.
-                    cropped_image_path = image[3]  # Local path to the cropped image.
-                    thumbnail_path = image[4]  # Local path to the thumbnail image.
-                    location = image[5]
-                    upload_date = image[6]
-                    confidence = image[7]
-                    group_name = image[8]
-                    animal = image[10]
-                    # Extract the filename of the bounding box image.
-                    bbox_image_filename = os.path.basename(bbox_image_path)
-                    extracted_image_name = bbox_image_filename.split('_')[-1]
-                    # print(f"Extracted image name: {extracted_image_name}")
-
-                    # Check if this image already exists in the online database.
-                    existing_photo = session.query(model.Photo).filter_by(name=extracted_image_name).first()
-                    if existing_photo:
-                        # If the image exists, mark it as synced in the local database and skip further processing.
-                        local_db.mark_image_as_synced(image[0])
-                        # print(f"Image '{bbox_image_filename}' already exists in the online database. Skipping upload.")
-                        continue
-
-                    # Prepare S3 keys (file paths in the S3 bucket) for each image type.
-                    bbox_s3_key = f"images/bbox/{bbox_image_filename}"
-                    cropped_s3_key = f"images/cropped/{os.path.basename(cropped_image_path)}"
-                    thumbnail_s3_key = f"images/thumbnails/{os.path.basename(thumbnail_path)}"
-
-                    # Upload each image to S3 and retrieve their URLs.
-                    bbox_s3_url = self.upload_to_s3(bbox_image_path, bbox_s3_key)
-                    cropped_s3_url = self.upload_to_s3(cropped_image_path, cropped_s3_key)
-                    thumbnail_s3_url = self.upload_to_s3(thumbnail_path, thumbnail_s3_key)
+            # The uploading user does not change during a run, so look it up once.
+            user = connection.get_user_id(self.current_user)
+            # Monotonic time of the last progress emit, used to throttle signals to the GUI thread.
+            last_emit = 0.0
+            # Photo rows created during this run, inserted together once all uploads are done.
+            records = []
+            # Local images to mark as synced, only once the online rows have been committed.
+            synced_ids = []
+            # Local images sharing a name with an image queued in this run, keyed by that name. They are
+            # synced only if the queued image is uploaded.
+            duplicate_ids = {}
+            # Images that still need uploading, paired with their online photo name.
+            to_upload = []
+
+            # Skip images that already exist online; images_tosync only returns unsynced rows.
+            for image in unsynced_images:
+                # Extract the photo name from the filename of the bounding box image.
+                extracted_image_name = os.path.basename(image.bbox_image_path).split('_')[-1]
+
+                if extracted_image_name in duplicate_ids:
+                    duplicate_ids[extracted_image_name].append(image.id)
+                    continue
+                # Check if this image already exists in the online database.
+                if session.query(model.Photo).filter_by(name=extracted_image_name).first():
+                    # If the image exists, it only needs marking as synced in the local database.
+                    synced_ids.append(image.id)
+                    continue
+                duplicate_ids[extracted_image_name] = []
+                to_upload.append((image, extracted_image_name))
+
+            # S3 uploads are I/O bound, so run a bounded number of them concurrently. The session and
+            # local database stay on this thread; only the uploads happen in the pool.
+            done = total_images - len(to_upload)
+            with ThreadPoolExecutor(max_workers=UPLOAD_CONCURRENCY) as executor:
+                futures = {executor.submit(self.upload_image_files, image): (image, name)
+                           for image, name in to_upload}
+                for future in as_completed(futures):
+                    image, extracted_image_name = futures[future]
+                    bbox_s3_url, cropped_s3_url, thumbnail_s3_url, bbox_s3_key, cropped_s3_key, thumbnail_s3_key = \
+                        future.result()
+                    done += 1
 
                     # If all images were uploaded successfully, add the new photo record to the online database.
                     if bbox_s3_url and cropped_s3_url and thumbnail_s3_url:
-                        new_photo = model.Photo(
+                        records.append(dict(
                             user_id=user,
                             image_data=bbox_s3_url,
-                            description=f'Cropped Image: {cropped_s3_url}, Thumbnail: {thumbnail_s3_url}',
-                            group_name=group_name,
-                            location=location,
+                            group_name=image.group_name,
+                            location=image.location,
                             is_synced=True,
-                            confidence=confidence,
+                            created_at=datetime.now(pytz.timezone('Pacific/Auckland')),
+                            confidence=image.confidence,
                             thumbnail=thumbnail_s3_url,
                             bbox=bbox_s3_url,
                             cropped=cropped_s3_url,
+                            bbox_key=bbox_s3_key,
+                            cropped_key=cropped_s3_key,
+                            thumbnail_key=thumbnail_s3_key,
                             name=extracted_image_name,
-                            animal=animal
-                        )
-
-                        # Mark the image as synced in the local database.
-                        local_db.mark_image_as_synced(image[0])
-                        session.add(new_photo)  # Add the new photo record to the session.
-
-                        # Calculate and emit progress updates.
-                        elapsed_time = time.time() - start_time
-                        estimated_time = (elapsed_time / (idx + 1)) * (total_images - (idx + 1))
-
-                        # Calculate the percentage of completion and the status message.
-                        progress_percentage = (idx + 1) * 100 // total_images
-                        status_message = f"{idx + 1}/{total_images} - Estimated Time Remaining: {estimated_time:.1f}s"
-                        self.progress_updated.emit(progress_percentage, status_message)
-
+                            animal=image.animal
+                        ))
+
+                        synced_ids.append(image.id)
+                        synced_ids.extend(duplicate_ids[extracted_image_name])
+
+                        # Emit progress at most every 200ms, always including the final image.
+                        now = time.monotonic()
+                        if now - last_emit >= 0.2 or done == total_images:
+                            elapsed_time = time.time() - start_time
+                            estimated_time = (elapsed_time / done) * (total_images - done)
+
+                            # Calculate the percentage of completion and the status message.
+                            progress_percentage = done * 100 // total_images
+                            status_message = f"{done}/{total_images} - Estimated Time Remaining: {estimated_time:.1f}s"
+                            self.progress_updated.emit(progress_percentage, status_message)
+                            last_emit = now
+
+            # Insert all new photos with a single executemany rather than per-object ORM flushes.
+            if records:
+                session.execute(insert(model.Photo), records)
             # Commit the session to save changes in the online database.
             session.commit()
+            # Only now are the images safely online, so mark them as synced in the local database.
+            local_db.mark_images_as_synced(synced_ids)
+            if records:
+                self.photos_added.emit([(record['group_name'], record['created_at'], record['thumbnail'])
+                                        for record in records])
             # print(f'Successfully uploaded {total_images} images to the online database.')
 
         except Exception as e:
@@ -166,6 +233,46 @@ class UploadThread(QThread):
             session.close()
 
 
+class S3FetcherSignals(QObject):
+    """Signals emitted by an S3Fetcher, delivered to the GUI thread."""
+    # Emitted with the S3 key of the image and its data, or None if the fetch failed.
+    finished = pyqtSignal(str, object)
+
+
+class S3Fetcher(QRunnable):
+    """Runnable that fetches one full image from S3 on a thread pool."""
+
+    def __init__(self, page, key):
+        super().__init__()
+        # The page whose S3 client is used to fetch the image.
+        self.page = page
+        self.key = key
+        self.signals = S3FetcherSignals()
+
+    def run(self):
+        """Fetch the image and report it back through the finished signal."""
+        self.signals.finished.emit(self.key, self.page.fetch_object_from_s3(self.key))
+
+
+class ZipDownload:
+    """State of one ZIP download, so downloads started while another is running do not share it.
+
+    Attributes:
+        zip_file (ZipFile): The archive the fetched images are written to.
+        progress (QProgressDialog): The dialog showing this download's progress.
+        pending (int): The number of fetches that have not reported back yet.
+        written (int): The number of images written to the archive so far.
+        fetchers (list): The S3Fetchers of this download, kept alive until it finishes.
+    """
+
+    def __init__(self, zip_file, progress, pending):
+        self.zip_file = zip_file
+        self.progress = progress
+        self.pending = pending
+        self.written = 0
+        self.fetchers = []
+
+
 class OnlineDatabasePage(QWidget):
     """
         A QWidget that represents a user interface for managing images in an online database.
@@ -237,10 +344,15 @@ class OnlineDatabasePage(QWidget):
         self.current_user = user
         self.s3_client = boto3.client('s3', aws_access_key_id=access_key_id,
                                       aws_secret_access_key=access_secret_key,
-                                      region_name='ap-southeast-2')
+                                      region_name='ap-southeast-2', config=s3_config)
         self.bucket_name = 'carewebbucket'
         self.local_db = DatabaseHelper()
         self.database_page = database_page
+        # Pool used to fetch downloads off the GUI thread.
+        self.download_pool = QThreadPool()
+        self.download_pool.setMaxThreadCount(32)
+        # ZIP downloads whose fetches are still running.
+        self.downloads = []
 
     def init_ui(self):
         """
@@ -315,6 +427,10 @@ class OnlineDatabasePage(QWidget):
         self.original_images = []
         self.selected_images = set()
         self.total_pages = max(1, (len(self.images) + self.images_per_page - 1) // self.images_per_page)
+        self.all_thumbnails = frozenset()
+        # While suspended, grid refreshes are deferred and run once when the suspension ends.
+        self._suspend_ui_updates = False
+        self._grid_update_pending = False
 
         self.select_all_checkbox = None
         self.in_delete_mode = False
@@ -378,6 +494,18 @@ class OnlineDatabasePage(QWidget):
 
         self.pagination_layout.addWidget(self.prev_button, alignment=Qt.AlignCenter)
         self.pagination_layout.addWidget(self.first_button, alignment=Qt.AlignCenter)
+
+        # Page number buttons are created once and relabelled on navigation.
+        self.max_visible_pages = 5
+        self.page_buttons = []
+        for _ in range(self.max_visible_pages):
+            page_button = QPushButton()
+            page_button.setFixedSize(40, 30)
+            page_button.clicked.connect(lambda _, b=page_button: self.go_to_page(int(b.text()) - 1))
+            page_button.setVisible(False)
+            self.page_buttons.append(page_button)
+            self.pagination_layout.addWidget(page_button, alignment=Qt.AlignCenter)
+
         self.pagination_layout.addWidget(self.last_button, alignment=Qt.AlignCenter)
         self.pagination_layout.addWidget(self.next_button, alignment=Qt.AlignCenter)
 
@@ -415,6 +543,7 @@ class OnlineDatabasePage(QWidget):
         self.progress_bar.setValue(0)
         self.upload_thread = UploadThread(self.current_user)
         self.upload_thread.progress_updated.connect(self.update_progress_bar)
+        self.upload_thread.photos_added.connect(self.add_photos_to_tree)
         self.upload_thread.finished.connect(self.upload_finished)
         self.upload_thread.start()
 
@@ -427,7 +556,6 @@ class OnlineDatabasePage(QWidget):
             status_message (str): A message indicating the status of the upload.
         """
         self.progress_bar.setValue(value)
-        print(status_message)
         self.progress_bar.setFormat(status_message)
         self.status_label.setText(status_message)
 
@@ -440,12 +568,10 @@ class OnlineDatabasePage(QWidget):
         self.status_label.setText("")
         QMessageBox.information(self, "Upload Complete", "All photos have been uploaded successfully!")
         self.update_sync_status()
-        self.tw.clear()
-        self.populate_tree_with_dates_and_folder()
         self.animal_combobox.clear()
         self.populate_animal_combobox()
         self.images = self.fetch_images_from_db()
-        self.total_pages = max(1, (len(self.images) + self.images_per_page - 1) // self.images_per_page)
+        self.recompute_total_pages()
         # self.update_image_grid()
 
     def get_pixmap_from_bytes(self, image_data):
@@ -475,6 +601,9 @@ class OnlineDatabasePage(QWidget):
         and the selected images. It manages the layout and applies styles based on the
         current modes (delete, download, reid).
         """
+        if self._suspend_ui_updates:
+            self._grid_update_pending = True
+            return
 
         while self.thumbnail_layout.count():
             item = self.thumbnail_layout.takeAt(0)
@@ -485,6 +614,16 @@ class OnlineDatabasePage(QWidget):
         start_index = self.current_page * self.images_per_page
         end_index = min(start_index + self.images_per_page, len(self.images))
 
+        # Resolve the selection border for the active mode once rather than per thumbnail.
+        if self.in_delete_mode:
+            selected_style = "border: 3px solid red;"
+        elif self.in_reid_mode:
+            selected_style = "border: 3px solid blue;"
+        elif self.in_download_mode:
+            selected_style = "border: 3px solid yellow;"
+        else:
+            selected_style = "border: none;"
+
         row, col = 0, 0
         for i in range(start_index, end_index):
             thumbnail_label = QLabel()
@@ -497,12 +636,7 @@ class OnlineDatabasePage(QWidget):
 
                 link = image_data[0]
                 if link in self.selected_images:
-                    if self.in_delete_mode:
-                        thumbnail_label.setStyleSheet("border: 3px solid red;")
-                    elif self.in_reid_mode:
-                        thumbnail_label.setStyleSheet("border: 3px solid blue;")
-                    elif self.in_download_mode:
-                        thumbnail_label.setStyleSheet("border: 3px solid yellow;")
+                    thumbnail_label.setStyleSheet(selected_style)
                 else:
                     thumbnail_label.setStyleSheet("border: none;")
 
@@ -538,6 +672,18 @@ class OnlineDatabasePage(QWidget):
 
         self.update_pagination()
 
+    @contextmanager
+    def suspend_ui_updates(self):
+        """Defer image grid refreshes until the end of a bulk operation, then refresh once."""
+        self._suspend_ui_updates = True
+        self._grid_update_pending = False
+        try:
+            yield
+        finally:
+            self._suspend_ui_updates = False
+            if self._grid_update_pending:
+                self.update_image_grid()
+
     def toggle_image_selection(self, link):
         """
         Toggles the selection state of an image based on its link.
@@ -692,8 +838,7 @@ class OnlineDatabasePage(QWidget):
             state (int): The state of the checkbox (0 for unchecked, 2 for checked).
         """
         if state == Qt.Checked:
-            for image in self.images:
-                self.selected_images.add(image[0])
+            self.selected_images.update(self.all_thumbnails)
         else:
             self.selected_images.clear()
 
@@ -718,25 +863,31 @@ class OnlineDatabasePage(QWidget):
                                                 f"Are you sure you want to delete {len(self.selected_images)} images? You will not be able to get these back! Please ensure you have these photos saved locally somewhere.",
                                                 QMessageBox.Yes | QMessageBox.No)
             if confirmation == QMessageBox.Yes:
-                deleted_images = []
+                # Thumbnails of the photos actually deleted; only filled in once the deletion is committed.
+                deleted_images = set()
                 session = Session()
                 try:
-                    for link in self.selected_images:
-                        photo = session.query(Photo).filter(Photo.thumbnail == link).first()
-
-                        if photo:
-                            self.delete_image_from_s3(photo.bbox)
-                            if photo.cropped:
-                                self.delete_image_from_s3(photo.cropped)
-                            if photo.thumbnail:
-                                self.delete_image_from_s3(photo.thumbnail)
-
-                            session.delete(photo)
-                            deleted_images.append(link)
-
+                    # Load every selected photo with one IN query rather than one query per thumbnail.
+                    photos = self.fetch_full_image_data_batch(self.selected_images, session).values()
+                    s3_keys = []
+                    thumbnails = set()
+                    for photo in photos:
+                        s3_keys.extend(key for key in self.photo_s3_keys(photo) if key)
+                        thumbnails.add(photo.thumbnail)
+
+                    if thumbnails:
+                        session.execute(delete(Photo).where(Photo.thumbnail.in_(thumbnails)))
                     session.commit()
-                    QMessageBox.information(self, "Deletion Complete",
-                                            f"{len(deleted_images)} images have been deleted.")
+                    deleted_images = thumbnails
+                    # Remove all the files from S3 in batches once the records are gone.
+                    failed_keys = self.delete_images_from_s3(s3_keys)
+                    if failed_keys:
+                        QMessageBox.warning(self, "Deletion Incomplete",
+                                            f"{len(deleted_images)} images have been deleted, but {len(failed_keys)} "
+                                            f"files could not be removed from S3.")
+                    else:
+                        QMessageBox.information(self, "Deletion Complete",
+                                                f"{len(deleted_images)} images have been deleted.")
 
                 except Exception as e:
                     session.rollback()
@@ -744,20 +895,23 @@ class OnlineDatabasePage(QWidget):
                 finally:
                     session.close()
 
-                self.selected_images.clear()
-                self.in_delete_mode = False
-                self.delete_button.setText("Delete Images")
-                self.remove_controls("delete")
-                self.delete_button.setEnabled(True)
-                self.delete_button.setVisible(True)
-                self.download_button.setEnabled(True)
-                self.download_button.setVisible(True)
-                self.reid_button.setEnabled(True)
-                self.reid_button.setVisible(True)
-                self.images = [img for img in self.images if img[0] not in deleted_images]
-                self.original_images = []
-                self.update_image_grid()
-                self.filter_by_animal()
+                with self.suspend_ui_updates():
+                    self.selected_images.clear()
+                    self.in_delete_mode = False
+                    self.delete_button.setText("Delete Images")
+                    self.remove_controls("delete")
+                    self.delete_button.setEnabled(True)
+                    self.delete_button.setVisible(True)
+                    self.download_button.setEnabled(True)
+                    self.download_button.setVisible(True)
+                    self.reid_button.setEnabled(True)
+                    self.reid_button.setVisible(True)
+                    # Keep the cached folder contents in step with the deletion; nothing is removed if it failed.
+                    self._images_by_folder = {folder: [img for img in images if img[0] not in deleted_images]
+                                              for folder, images in self._images_by_folder.items()}
+                    self.original_images = [img for img in self.original_images if img[0] not in deleted_images]
+                    self.filter_by_animal()
+                    self.update_image_grid()
 
     def confirm_reid_selected(self):
         """
@@ -775,50 +929,49 @@ class OnlineDatabasePage(QWidget):
         thumbnail_directory = "app/detection_model/temporary_detected_images/thumbnails"
 
         try:
-            for link in self.selected_images:
-                photo = self.fetch_full_image_data(link)
-                user_id = photo[0]
-                description = photo[1]
-                date = photo[2]
-                confidence = photo[3]
-                location = photo[4]
-                bbox = photo[5]
-                bbox = bbox.replace("bbox_images", "bbox")
-                cropped = photo[6]
-                cropped = cropped.replace("crop_images", "cropped")
-                group_name = photo[-3]
-                thumbnail = photo[-4]
-                name = photo[-2]
-                animal = photo[10]
-
-                bbox_photo = self.fetch_image_from_s3((bbox,))
-                thumbnail_photo = self.fetch_image_from_s3((thumbnail,))
-                cropped_photo = self.fetch_image_from_s3((cropped,))
-
-                if bbox_photo:
-                    bbox_image_path = os.path.join(bbox_directory, os.path.basename(bbox))
-                    with open(bbox_image_path, 'wb') as f:
-                        f.write(bbox_photo)
-
-                if cropped_photo:
-                    cropped_image_path = os.path.join(crop_directory, os.path.basename(cropped))
-                    with open(cropped_image_path, 'wb') as f:
-                        f.write(cropped_photo)
-
-                if thumbnail_photo:
-                    thumbnail_path = os.path.join(thumbnail_directory, os.path.basename(thumbnail))
-                    with open(thumbnail_path, 'wb') as f:
-                        f.write(thumbnail_photo)
+            # Stage 1: load the metadata of every selected photo in one query.
+            photos = list(self.fetch_full_image_data_batch(self.selected_images).values())
+
+            # Stage 2: resolve every S3 key and local destination up front, skipping photos missing any image.
+            entries = []
+            for photo in photos:
+                try:
+                    keys = self.photo_s3_keys(photo)
+                except Exception as e:
+                    print(f"Skipping {photo.name}: its S3 keys could not be resolved: {e}")
+                    continue
+                if None in keys:
+                    print(f"Skipping {photo.name}: it does not have all of its images.")
+                    continue
+                entries.append((photo, [(key, os.path.join(directory, os.path.basename(key)))
+                                        for key, directory in zip(keys, (bbox_directory, crop_directory,
+                                                                         thumbnail_directory))]))
+
+            # Stage 3: stream all objects to disk in parallel; each file has a single writer.
+            downloads = [download for _, photo_downloads in entries for download in photo_downloads]
+            saved = iter(s3_pool.map(lambda download: self.save_image_from_s3(*download), downloads))
+
+            # Stage 4: collect the local rows and insert them together in one transaction.
+            rows = []
+            for photo, photo_downloads in entries:
+                # The results come back in order, so take this photo's three from the shared iterator.
+                if not all([next(saved) for _ in photo_downloads]):
+                    print(f"Skipping {photo.name}: not all of its images could be downloaded.")
+                    continue
+                bbox_image_path, cropped_image_path, thumbnail_path = (path for _, path in photo_downloads)
+                confidence = photo.confidence
+                location = photo.location
+                animal = photo.animal
 
                 run_datetime = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-                self.local_db.insert_image(
-                    self.current_user, bbox_image_path, cropped_image_path, thumbnail_path, location,
-                    run_datetime, confidence, new_name, animal
-                )
+                rows.append((self.current_user, bbox_image_path, cropped_image_path, thumbnail_path, location,
+                             run_datetime, confidence, new_name, animal))
+
+            self.local_db.insert_images_bulk(rows)
 
             QMessageBox.information(self, "Download Complete",
-                                    f"{len(self.selected_images)} image/s have been downloaded and saved to the local database successfully!")
+                                    f"{len(rows)} image/s have been downloaded and saved to the local database successfully!")
 
         except Exception as e:
             QMessageBox.critical(self, "Download Error", f"An error occurred while downloading images: {str(e)}")
@@ -856,22 +1009,39 @@ class OnlineDatabasePage(QWidget):
             zip_filename += ".zip"
 
         try:
-            with zipfile.ZipFile(zip_filename, 'w') as zipf:
-                for link in self.selected_images:
-                    full_image_url = self.fetch_full_image_from_db(link)
-                    full_image_url = full_image_url.replace("bbox_images", "bbox")
-                    if full_image_url:
-                        full_image_data = self.fetch_image_from_s3((full_image_url,))
-                        if full_image_data:
-                            with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-                                tmp_file.write(full_image_data)
-                                tmp_file.close()
-
-                                zipf.write(tmp_file.name, os.path.basename(full_image_url))
-                                os.unlink(tmp_file.name)
+            photos = list(self.fetch_full_image_data_batch(self.selected_images).values())
 
-            QMessageBox.information(self, "Download Complete",
-                                    f"{len(self.selected_images)} images have been zipped and saved successfully!")
+            # Resolve every key up front, so a photo without one is skipped rather than leaving a fetch
+            # that never completes.
+            keys = []
+            for photo in photos:
+                try:
+                    key = self.photo_s3_keys(photo)[0]
+                except Exception as e:
+                    print(f"Error resolving the S3 key of {photo.name}: {e}")
+                    continue
+                if key:
+                    keys.append(key)
+
+            # The images are already compressed JPEGs, so store them rather than deflating again.
+            zip_file = zipfile.ZipFile(zip_filename, 'w', compression=zipfile.ZIP_STORED)
+
+            progress = QProgressDialog("Downloading images...", None, 0, len(keys), self)
+            progress.setWindowModality(Qt.WindowModal)
+            progress.show()
+            download = ZipDownload(zip_file, progress, len(keys))
+            self.downloads.append(download)
+
+            # Fetch the images on the thread pool; each is written to the ZIP when it arrives on the GUI thread.
+            # The download is bound into each connection, so late results always reach their own archive.
+            for key in keys:
+                fetcher = S3Fetcher(self, key)
+                fetcher.signals.finished.connect(
+                    lambda key, data, download=download: self.add_image_to_zip(download, key, data))
+                download.fetchers.append(fetcher)
+                self.download_pool.start(fetcher)
+            if not keys:
+                self.finish_download(download)
 
         except Exception as e:
             QMessageBox.critical(self, "Download Error", f"An error occurred while creating the ZIP file: {str(e)}")
@@ -888,6 +1058,59 @@ class OnlineDatabasePage(QWidget):
         self.reid_button.setVisible(True)
         self.update_image_grid()
 
+    def add_image_to_zip(self, download, full_image_key, full_image_data):
+        """Write a fetched image into the ZIP file of the download it belongs to.
+
+        Args:
+            download (ZipDownload): The download the image was fetched for.
+            full_image_key (str): The S3 key of the image.
+            full_image_data (bytes or None): The image data, or None if it could not be fetched.
+
+        Returns:
+            None
+        """
+        if full_image_data:
+            try:
+                download.zip_file.writestr(os.path.basename(full_image_key), full_image_data)
+                download.written += 1
+            except Exception as e:
+                print(f"Error writing {full_image_key} to the ZIP file: {e}")
+        download.pending -= 1
+        download.progress.setValue(download.progress.maximum() - download.pending)
+        if download.pending == 0:
+            self.finish_download(download)
+
+    def finish_download(self, download):
+        """Close a downloaded ZIP file and let the user know it has been saved.
+
+        Args:
+            download (ZipDownload): The download that has finished.
+
+        Returns:
+            None
+        """
+        download.zip_file.close()
+        download.progress.close()
+        self.downloads.remove(download)
+        QMessageBox.information(self, "Download Complete",
+                                f"{download.written} images have been zipped and saved successfully!")
+
+    def photo_s3_keys(self, photo):
+        """Return the S3 keys of a photo's bbox, cropped and thumbnail images.
+
+        Photos stored by older versions may lack keys, in which case they are derived from the URLs.
+
+        Args:
+            photo (Photo): The photo record.
+
+        Returns:
+            tuple: The (bbox, cropped, thumbnail) S3 keys, None for any image the photo does not have.
+        """
+        return tuple(key or (self.s3_key_from_url(url) if url else None)
+                     for key, url in ((photo.bbox_key, photo.bbox),
+                                      (photo.cropped_key, photo.cropped),
+                                      (photo.thumbnail_key, photo.thumbnail)))
+
     def open_image_popup(self, image_data):
         """Open a popup dialog to display a full image along with its details.
 
@@ -899,23 +1122,21 @@ class OnlineDatabasePage(QWidget):
         """
         thumbnail_url = image_data[0]
 
-        full_image_url = self.fetch_full_image_from_db(thumbnail_url)
-        full_image_url = full_image_url.replace("bbox_images", "bbox")
+        # Look the photo up once and use it for both the full image URL and its details.
+        with Session() as session:
+            photo = session.query(Photo).filter(Photo.thumbnail == thumbnail_url).first()
 
-        if not full_image_url:
+        if not photo or not photo.bbox:
             print(f"No full image found for the thumbnail: {thumbnail_url}")
             return
+        full_image_key = self.photo_s3_keys(photo)[0]
 
         popup = QDialog(self, Qt.Window)
         popup.setWindowTitle("Full Image")
         popup.setGeometry(100, 100, 800, 600)
 
         layout = QVBoxLayout(popup)
-        full = (full_image_url,)
-        full_image_data = self.fetch_image_from_s3(full, )
-        session = Session()
-        photo = session.query(Photo).filter(Photo.thumbnail == thumbnail_url).first()
-        session.close()
+        full_image_data = self.fetch_object_from_s3(full_image_key)
 
         if full_image_data:
             image_label = QLabel(popup)
@@ -928,8 +1149,8 @@ class OnlineDatabasePage(QWidget):
             group_label.setObjectName("groupLabel")
             confidence_label = QLabel(f'Confidence: {photo.confidence}')
             confidence_label.setObjectName("confidenceLabel")
-            uploaded_by = connection.get_user_by_id(photo.user_id)
-            uploaded_label = QLabel(f'Uploaded by: {uploaded_by.username}')
+            uploaded_by = connection.get_username_by_id(photo.user_id)
+            uploaded_label = QLabel(f'Uploaded by: {uploaded_by}')
             uploaded_label.setObjectName("userLabel")
             animal_label = QLabel(f'Animal: {photo.animal}')
             animal_label.setObjectName("animalLabel")
@@ -948,7 +1169,7 @@ class OnlineDatabasePage(QWidget):
             popup.setLayout(layout)
             popup.show()
         else:
-            print(f"Failed to fetch full image from S3 for URL: {full_image_url}")
+            print(f"Failed to fetch full image from S3 for key: {full_image_key}")
 
     def update_pagination(self):
         """Update the pagination controls based on the current image page.
@@ -956,36 +1177,40 @@ class OnlineDatabasePage(QWidget):
         Returns:
             None
         """
-        for i in reversed(range(self.pagination_layout.count())):
-            widget = self.pagination_layout.itemAt(i).widget()
-            if isinstance(widget, QPushButton) and widget not in [self.prev_button, self.next_button, self.last_button,
-                                                                  self.first_button]:
-                self.pagination_layout.removeWidget(widget)
-                widget.deleteLater()
-
-        total_pages = max(1, (len(self.images) + self.images_per_page - 1) // self.images_per_page)
+        total_pages = self.total_pages
 
         self.first_button.setEnabled(self.current_page > 0)
         self.prev_button.setEnabled(self.current_page > 0)
         self.next_button.setEnabled((self.current_page + 1) * self.images_per_page < len(self.images))
         self.last_button.setEnabled(self.current_page < total_pages - 1)
 
-        max_visible_pages = 5
+        max_visible_pages = self.max_visible_pages
         start_page = max(0, min(self.current_page - max_visible_pages // 2, total_pages - max_visible_pages))
         end_page = min(total_pages, start_page + max_visible_pages)
 
-        for page_num in range(start_page, end_page):
-            page_button = QPushButton(str(page_num + 1))
-            page_button.setFixedSize(40, 30)
+        for index, page_button in enumerate(self.page_buttons):
+            page_num = start_page + index
+            if page_num >= end_page:
+                page_button.setVisible(False)
+                continue
+            page_button.setText(str(page_num + 1))
 
-            if page_num == self.current_page:
-                page_button.setObjectName("selectedPageButton")
-            else:
-                page_button.setObjectName("unselectedPageButton")
+            object_name = "selectedPageButton" if page_num == self.current_page else "unselectedPageButton"
+            if page_button.objectName() != object_name:
+                # The stylesheet selects on object name, so re-polish when it changes.
+                page_button.setObjectName(object_name)
+                page_button.style().unpolish(page_button)
+                page_button.style().polish(page_button)
+            page_button.setVisible(True)
 
-            page_button.clicked.connect(lambda _, p=page_num: self.go_to_page(p))
-            self.pagination_layout.insertWidget(self.pagination_layout.count() - 2, page_button,
-                                                alignment=Qt.AlignCenter)
+    def recompute_total_pages(self):
+        """Recompute the number of pages and the set of thumbnails after the displayed images change.
+
+        Returns:
+            None
+        """
+        self.total_pages = max(1, (len(self.images) + self.images_per_page - 1) // self.images_per_page)
+        self.all_thumbnails = frozenset(image[0] for image in self.images)
 
     def go_to_last_page(self):
         """Navigate to the last page of images.
@@ -993,8 +1218,7 @@ class OnlineDatabasePage(QWidget):
         Returns:
             None
         """
-        total_pages = max(1, (len(self.images) + self.images_per_page - 1) // self.images_per_page)
-        self.go_to_page(total_pages - 1)
+        self.go_to_page(self.total_pages - 1)
 
     def go_to_first_page(self):
         """Navigate to the first page of images.
@@ -1015,7 +1239,7 @@ class OnlineDatabasePage(QWidget):
             None
         """
         try:
-            total_pages = max(1, (len(self.images) + self.images_per_page - 1) // self.images_per_page)
+            total_pages = self.total_pages
 
             if 0 <= page_num < total_pages:
                 self.current_page = page_num
@@ -1059,17 +1283,60 @@ class OnlineDatabasePage(QWidget):
         Returns:
             None
         """
-        for date, folders in sorted(connection.get_folder_names().items()):
-            folder_count = len(folders)
-            date_str = date.strftime("%Y-%m-%d")
-            date_item = QTreeWidgetItem(self.tw)
-            # date_item.setText(0, date_str)
-            date_item.setText(0, f"{date_str} ({folder_count} folder/s)")
+        # Tree nodes are tracked so later uploads can be added without rebuilding the tree.
+        self._tree_date_items = {}
+        self._tree_folder_items = {}
+        # Folder names and their images are cached so tree clicks do not query the database again.
+        self._folders_by_date = connection.get_folder_names()
+        self._images_by_folder = connection.get_images_by_folders(
+            set(chain.from_iterable(self._folders_by_date.values())))
+        for date, folders in sorted(self._folders_by_date.items()):
             for folder in folders:
-                images_in_folder = connection.get_image_by_folder(folder)
-                image_count = len(images_in_folder)
-                folder_item = QTreeWidgetItem(date_item)
-                folder_item.setText(0, f"{folder} ({image_count} images)")
+                self.add_folder_to_tree(date, folder, len(self._images_by_folder[folder]))
+
+    def add_folder_to_tree(self, date, folder, image_count):
+        """Add images to a folder node in the tree, creating the date and folder nodes if needed.
+
+        Args:
+            date (date): The date the images were created.
+            folder (str): The folder name the images belong to.
+            image_count (int): The number of images to add to the folder.
+
+        Returns:
+            None
+        """
+        date_item = self._tree_date_items.get(date)
+        if date_item is None:
+            # Insert new dates at their sorted position among the existing ones.
+            index = bisect_left(sorted(self._tree_date_items), date)
+            date_item = QTreeWidgetItem()
+            self.tw.insertTopLevelItem(index, date_item)
+            self._tree_date_items[date] = date_item
+
+        folder_entry = self._tree_folder_items.get((date, folder))
+        if folder_entry is None:
+            folder_entry = [QTreeWidgetItem(date_item), 0]
+            self._tree_folder_items[(date, folder)] = folder_entry
+        folder_entry[1] += image_count
+        folder_entry[0].setText(0, f"{folder} ({folder_entry[1]} images)")
+        date_item.setText(0, f"{date.strftime('%Y-%m-%d')} ({date_item.childCount()} folder/s)")
+
+    def add_photos_to_tree(self, photos):
+        """Add newly uploaded photos to the tree widget without rebuilding it.
+
+        Args:
+            photos (list): A list of (group_name, created_at, thumbnail) tuples for the new photos.
+
+        Returns:
+            None
+        """
+        for group_name, created_at, thumbnail in photos:
+            date, folder = created_at.date(), group_name[:-16]
+            folders = self._folders_by_date.setdefault(date, [])
+            if folder not in folders:
+                folders.append(folder)
+            self._images_by_folder.setdefault(folder, []).append((thumbnail,))
+            self.add_folder_to_tree(date, folder, 1)
 
     def tree_click(self, item, column):
         """Handle clicks on the tree widget to update images based on the selected folder or date.
@@ -1084,7 +1351,7 @@ class OnlineDatabasePage(QWidget):
         if item.parent() is not None:
             folder_name_with_images = item.text(column)
             folder_name = folder_name_with_images.split(" (")[0]
-            self.images = connection.get_image_by_folder(folder_name)
+            self.images = list(self._images_by_folder.get(folder_name, []))
         else:
             date_with_folder_count = item.text(column)
             date_str = date_with_folder_count.split(" (")[0]
@@ -1092,19 +1359,12 @@ class OnlineDatabasePage(QWidget):
                 date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
             except ValueError:
                 return
-            all_images_for_date = []
-            folders = connection.get_folder_names().get(date_obj)
-            if folders:
-                for folder in folders:
-                    images_in_folder = connection.get_image_by_folder(folder)
-                    all_images_for_date.extend(images_in_folder)
-            self.images = all_images_for_date
+            folders = self._folders_by_date.get(date_obj, [])
+            self.images = list(chain.from_iterable(self._images_by_folder.get(folder, []) for folder in folders))
         self.original_images = self.images
         self.current_page = 0
         self.filter_by_animal()
         self.update_image_grid()
-        self.total_pages = max(1, (len(self.images) + self.images_per_page - 1) // self.images_per_page)
-        self.update_pagination()
         self.download_button.setEnabled(True)
         self.delete_button.setEnabled(True)
         self.reid_button.setEnabled(True)
@@ -1141,87 +1401,143 @@ class OnlineDatabasePage(QWidget):
         split_keyword = "temporary_detected_images"
         split_part = url.split(split_keyword, 1)[1]
         split_key = f"images{split_part}"
-        key = split_key
+        return self.fetch_object_from_s3(split_key)
+
+    def fetch_object_from_s3(self, key):
+        """Fetch an object from Amazon S3 by its key.
+
+        Args:
+            key (str): The key of the object in the S3 bucket.
+
+        Returns:
+            bytes or None: The object data if successful, otherwise None.
+        """
         try:
-            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
-            return response['Body'].read()
+            # Request only the first part; its Content-Range reveals whether more parts are needed.
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key,
+                                                 Range=f"bytes=0-{RANGE_PART_SIZE - 1}")
+            data = response['Body'].read()
+            content_range = response.get('ContentRange')
+            total_size = int(content_range.rsplit('/', 1)[1]) if content_range else len(data)
+            if total_size <= len(data):
+                return data
+            return self.fetch_image_from_s3_ranged(key, data, total_size)
         except Exception as e:
             print(f"Error fetching image from S3: {e}")
             return None
 
-    def delete_image_from_s3(self, image_url):
-        """Delete an image from Amazon S3.
+    def fetch_image_from_s3_ranged(self, key, first_part, total_size):
+        """Fetch the remainder of a large S3 object as parallel byte-range requests.
 
         Args:
-            image_url (str): The URL of the image to be deleted.
+            key (str): The key of the object in the S3 bucket.
+            first_part (bytes): The already fetched start of the object.
+            total_size (int): The full size of the object in bytes.
 
         Returns:
-            None
+            bytes: The complete object data.
         """
-        try:
-            split_key = image_url.split(f'https://{self.bucket_name}.s3.amazonaws.com/')
-            key = split_key[1]
-            key_list = key.split('app/detection_model/temporary_detected_')
-            s3_key = key_list[1]
-            s3_key = s3_key.replace("bbox_images", "bbox")
-            s3_key = s3_key.replace("crop_images", "cropped")
-            self.s3_client.delete_object(Bucket=self.bucket_name, Key=s3_key)
-            print(f"Deleted {s3_key} from S3.")
+        buffer = bytearray(total_size)
+        buffer[:len(first_part)] = first_part
 
-        except Exception as e:
-            print(f"Error deleting image from S3: {str(e)}")
+        def fetch_part(start):
+            end = min(start + RANGE_PART_SIZE, total_size) - 1
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key, Range=f"bytes={start}-{end}")
+            return start, response['Body'].read()
+
+        for start, part in range_pool.map(fetch_part, range(len(first_part), total_size, RANGE_PART_SIZE)):
+            buffer[start:start + len(part)] = part
+        return bytes(buffer)
+
+    def s3_key_from_url(self, image_url):
+        """Derive the S3 object key for a stored image URL.
+
+        Args:
+            image_url (str): The URL of the image.
+
+        Returns:
+            str: The key of the image in the S3 bucket.
+        """
+        s3_key = S3_KEY_PATTERN.search(image_url).group(1)
+        return s3_key.replace("bbox_images", "bbox").replace("crop_images", "cropped")
+
+    def fetch_image_stream_to(self, key, sink):
+        """Stream an image from Amazon S3 into a writable file object without holding it in memory.
 
-    def fetch_full_image_from_db(self, thumbnail_url):
+        Args:
+            key (str): The key of the image in the S3 bucket.
+            sink (file): A binary file object the image data is written to.
+
+        Returns:
+            bool: True if the image was streamed successfully, otherwise False.
         """
-        Fetch the bounding box of a full image from the database using the thumbnail URL.
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+            shutil.copyfileobj(response['Body'], sink, length=1 << 20)
+            return True
+        except Exception as e:
+            print(f"Error fetching image from S3: {e}")
+            return False
+
+    def save_image_from_s3(self, key, path):
+        """Download an image from Amazon S3 straight to a local file.
 
         Args:
-            thumbnail_url (str): The URL of the thumbnail image.
+            key (str): The key of the image in the S3 bucket.
+            path (str): The local file path to write the image to.
 
         Returns:
-            bbox (str or None): The bounding box of the full image if found, otherwise None.
+            bool: True if the image was saved, otherwise False.
         """
+        with open(path, 'wb') as f:
+            saved = self.fetch_image_stream_to(key, f)
+        if not saved:
+            os.remove(path)
+        return saved
 
-        session = Session()
-        photo = session.query(Photo).filter(Photo.thumbnail == thumbnail_url).first()
+    def delete_images_from_s3(self, keys):
+        """Delete several images from Amazon S3 using batched delete_objects requests.
 
-        if photo:
-            return photo.bbox
-        else:
-            print(f"No image found for thumbnail: {thumbnail_url}")
-            return None
+        Args:
+            keys (list): The S3 keys of the images to be deleted.
 
-    def fetch_full_image_data(self, thumbnail_url):
-        """Fetch detailed information about a full image from the database using the thumbnail URL.
+        Returns:
+            list: The S3 keys that could not be deleted.
+        """
+        failed_keys = []
+        # delete_objects accepts at most 1000 keys per request.
+        for start in range(0, len(keys), 1000):
+            chunk = keys[start:start + 1000]
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name, Delete={"Objects": [{"Key": key} for key in chunk], "Quiet": True})
+            except Exception as e:
+                print(f"Error deleting images from S3: {str(e)}")
+                failed_keys.extend(chunk)
+                continue
+            # In quiet mode the response only lists the objects that could not be deleted.
+            for error in response.get("Errors", []):
+                print(f"Error deleting {error.get('Key')} from S3: {error.get('Message')}")
+                failed_keys.append(error.get("Key"))
+        print(f"Deleted {len(keys) - len(failed_keys)} of {len(keys)} objects from S3.")
+        return failed_keys
+
+    def fetch_full_image_data_batch(self, thumbnail_urls, session=None):
+        """Fetch the photo records for several thumbnails with a single query.
 
         Args:
-            thumbnail_url (str): The URL of the thumbnail image.
+            thumbnail_urls (iterable): The URLs of the thumbnail images.
+            session (Session, optional): An open session to reuse; a new one is opened if not given.
 
         Returns:
-            tuple or None: A tuple containing user ID, description, date, confidence,
-                           location, bounding box, cropped status, thumbnail URL,
-                           group name, and image name if found; otherwise, None.
+            dict: A dictionary mapping each found thumbnail URL to its Photo record.
         """
-        session = Session()
-        photo = session.query(Photo).filter(Photo.thumbnail == thumbnail_url).first()
-
-        if photo:
-            user_id = photo.user_id
-            description = photo.description
-            date = photo.created_at
-            confidence = photo.confidence
-            location = photo.location
-            bbox = photo.bbox
-            cropped = photo.cropped
-            group_name = photo.group_name
-            thumbnail = photo.thumbnail
-            name = photo.name
-            animal = photo.animal
-            return (user_id, description, date, confidence, location, bbox, cropped, thumbnail, group_name, name, animal)
+        if session is None:
+            with Session() as session:
+                return self.fetch_full_image_data_batch(thumbnail_urls, session)
 
-        else:
-            print(f"No image found for thumbnail: {thumbnail_url}")
-            return None
+        photos = session.query(Photo).filter(Photo.thumbnail.in_(list(thumbnail_urls))).all()
+        return {photo.thumbnail: photo for photo in photos}
 
     def populate_animal_combobox(self):
         """Populate the animal combo box with distinct animal names from the database.
@@ -1249,6 +1565,7 @@ class OnlineDatabasePage(QWidget):
             filtered_images = connection.get_animals_by_filter(self.original_images, selected_animal)
 
         self.images = filtered_images
+        self.recompute_total_pages()
 
     def refresh_database(self):
         """Refresh the database view by clearing the tree widget and reloading data.
@@ -1,14 +1,250 @@
+import hashlib
 import os
+import tempfile
 import zipfile
+from collections import namedtuple
+from functools import lru_cache
 
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtGui import QPixmap, QPixmapCache, QImage
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTreeWidget, QTreeWidgetItem, QLabel, QPushButton, QHBoxLayout, \
-    QGridLayout, QFrame, QSizePolicy, QProgressBar, QDialog, QCheckBox, QMessageBox, QFileDialog
-from PyQt5.QtCore import Qt
+    QGridLayout, QFrame, QSizePolicy, QProgressBar, QDialog, QCheckBox, QMessageBox, QFileDialog, QProgressDialog
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, QStandardPaths, QTimer, pyqtSignal
 from app.util.database_helper import DatabaseHelper
 from datetime import datetime
 
 database_helper = DatabaseHelper()
+
+@lru_cache(maxsize=1)
+def load_reid_css():
+    """
+    Reads the REID page stylesheet, which is only read from disk once per run.
+
+    Returns:
+        str: The contents of reid_page.css.
+    """
+    css_file = os.path.join(os.path.dirname(__file__), 'css', 'reid_page.css')
+    with open(css_file, 'r') as f:
+        return f.read()
+
+
+# Pre-scaled thumbnails persist here across restarts, bounded to THUMB_CACHE_MAX_BYTES.
+THUMB_CACHE_DIR = os.path.join(QStandardPaths.writableLocation(QStandardPaths.CacheLocation), 'reid_thumb_cache')
+THUMB_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+
+def cached_thumbnail_path(thumbnail_path, size):
+    """
+    Returns the path of a pre-scaled copy of a thumbnail, generating it on first use.
+
+    The cache key includes the source modification time so edited images are re-scaled. Cached copies are
+    written to a temporary file and moved into place, so a concurrent reader never sees a partial file, and
+    are touched on every hit so prune_thumbnail_cache can evict the least recently used ones.
+
+    Args:
+        thumbnail_path (str): The file path of the source thumbnail image.
+        size (tuple): The (width, height) to scale the thumbnail to.
+
+    Returns:
+        str: The cached file path, or the source path if it could not be cached.
+    """
+    try:
+        mtime = os.path.getmtime(thumbnail_path)
+    except OSError:
+        return thumbnail_path
+
+    key = hashlib.sha1(f"{thumbnail_path}{mtime}{size}".encode()).hexdigest()
+    cache_path = os.path.join(THUMB_CACHE_DIR, key + '.jpg')
+    try:
+        os.utime(cache_path)
+        return cache_path
+    except OSError:
+        pass
+
+    os.makedirs(THUMB_CACHE_DIR, exist_ok=True)
+    image = QImage(thumbnail_path).scaled(*size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    if image.isNull():
+        return thumbnail_path
+    fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=THUMB_CACHE_DIR)
+    os.close(fd)
+    try:
+        if not image.save(temp_path, 'JPG', 85):
+            os.remove(temp_path)
+            return thumbnail_path
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print(f"Error caching thumbnail {thumbnail_path}: {e}")
+        return thumbnail_path
+    return cache_path
+
+
+def prune_thumbnail_cache(max_bytes=THUMB_CACHE_MAX_BYTES):
+    """
+    Removes the least recently used cached thumbnails until the cache fits within max_bytes.
+
+    Args:
+        max_bytes (int): The maximum total size of the cache directory in bytes.
+    """
+    try:
+        entries = [entry for entry in os.scandir(THUMB_CACHE_DIR) if entry.is_file()]
+    except FileNotFoundError:
+        return
+
+    # Access times are often not recorded, so cache hits touch the modification time instead.
+    stats = [(entry.stat(), entry.path) for entry in entries]
+    total = sum(stat.st_size for stat, _ in stats)
+    for stat, path in sorted(stats, key=lambda item: item[0].st_mtime):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= stat.st_size
+        except OSError as e:
+            print(f"Error removing cached thumbnail {path}: {e}")
+
+
+# Buffer size for the ZIP output file, so each stored image is written in a few large syscalls.
+ZIP_WRITE_BUFFER = 4 * 1024 * 1024
+
+
+class ZipWriterSignals(QObject):
+    """
+    Signals emitted by a ZipWriter.
+
+    Attributes:
+        progress (pyqtSignal): Emitted with the number of images written so far.
+        finished (pyqtSignal): Emitted with an error message, or an empty string on success.
+    """
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(str)
+
+
+class ZipWriter(QRunnable):
+    """
+    Writes REID images into a ZIP file on a worker thread.
+    """
+    def __init__(self, zip_filename, image_paths):
+        """
+        Initializes the writer.
+
+        Args:
+            zip_filename (str): The path of the ZIP file to create.
+            image_paths (list): (bbox_image_path, cropped_image_path, thumbnail_path) tuples to add.
+        """
+        super().__init__()
+        self.zip_filename = zip_filename
+        # Archive names are worked out once up front rather than inside the write loop.
+        self.entries = [[(path, os.path.basename(path)) for path in paths if path] for paths in image_paths]
+        self.signals = ZipWriterSignals()
+
+    def run(self):
+        """
+        Writes every image into the archive, reporting progress after each image set.
+        """
+        try:
+            # The images are already compressed JPEGs, so store them rather than deflating again.
+            with open(self.zip_filename, 'wb', buffering=ZIP_WRITE_BUFFER) as fh, \
+                    zipfile.ZipFile(fh, 'w', zipfile.ZIP_STORED) as zipf:
+                for written, entries in enumerate(self.entries, start=1):
+                    for path, arcname in entries:
+                        try:
+                            zipf.write(path, arcname)
+                        except FileNotFoundError:
+                            pass
+                    self.signals.progress.emit(written)
+        except Exception as e:
+            self.signals.finished.emit(str(e))
+            return
+        self.signals.finished.emit("")
+
+
+class ThumbLabel(QLabel):
+    """
+    A thumbnail label that emits the image it currently shows when clicked.
+
+    Attributes:
+        clicked (pyqtSignal): Emitted with the label's payload on a mouse press.
+    """
+    clicked = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        """
+        Initializes the label with no payload.
+
+        Args:
+            parent (QWidget): The parent widget.
+        """
+        super().__init__(parent)
+        self.payload = None
+
+    def mousePressEvent(self, event):
+        """
+        Emits the clicked signal with the current payload.
+
+        Args:
+            event (QMouseEvent): The mouse press event.
+        """
+        self.clicked.emit(self.payload)
+
+
+# A reusable grid cell holding one thumbnail and its hover overlay.
+ThumbSlot = namedtuple("ThumbSlot", "container thumbnail_label overlay_label")
+
+
+class ThumbLoaderSignals(QObject):
+    """
+    Signals emitted by a ThumbLoader, which cannot emit signals itself as a QRunnable.
+
+    Attributes:
+        done (pyqtSignal): Emitted with the thumbnail path and its decoded, scaled image.
+    """
+    done = pyqtSignal(str, QImage)
+
+
+class ThumbLoader(QRunnable):
+    """
+    Decodes and scales a single thumbnail on a worker thread.
+
+    QPixmap may only be used on the GUI thread, so the worker produces a QImage which the
+    receiver converts.
+    """
+    def __init__(self, thumbnail_path, size):
+        """
+        Initializes the loader for one thumbnail.
+
+        Args:
+            thumbnail_path (str): The file path of the thumbnail image.
+            size (tuple): The (width, height) to scale the thumbnail to.
+        """
+        super().__init__()
+        self.thumbnail_path = thumbnail_path
+        self.size = size
+        self.signals = ThumbLoaderSignals()
+
+    def run(self):
+        """
+        Loads the pre-scaled copy of the thumbnail and emits it through the done signal.
+        """
+        image = QImage(cached_thumbnail_path(self.thumbnail_path, self.size))
+        if image.isNull():
+            # The cached copy may have been pruned since it was looked up, so decode the source instead.
+            image = QImage(self.thumbnail_path)
+        if image.size().width() > self.size[0] or image.size().height() > self.size[1]:
+            # Grid thumbnails are small enough that nearest-neighbour scaling is indistinguishable.
+            image = image.scaled(*self.size, Qt.KeepAspectRatio, Qt.FastTransformation)
+        self.signals.done.emit(self.thumbnail_path, image)
+
+
+class ThumbCachePruner(QRunnable):
+    """
+    Trims the on-disk thumbnail cache on a worker thread.
+    """
+    def run(self):
+        """
+        Prunes the thumbnail cache to its size limit.
+        """
+        prune_thumbnail_cache()
+
+
 class ReIDDatabase(QWidget):
     """
     A QWidget for managing and displaying a database of REID images.
@@ -46,6 +282,41 @@ class ReIDDatabase(QWidget):
         self.thumbnail_layout.setAlignment(Qt.AlignTop)
         self.layout.addWidget(self.thumbnail_frame)
         self.thumbnail_size = (150, 150)
+        # Decoded, pre-scaled thumbnails are kept in QPixmapCache (sized at startup in main.py) so page flips
+        # and selection changes skip decoding.
+        self.images_per_page = 10
+
+        # Thumbnails are decoded off the GUI thread; a grey placeholder is shown until each one arrives.
+        self.thumb_pool = QThreadPool()
+        self.thumb_priority = 0
+        self.loading_thumbs = set()
+        self.visible_thumbs = {}
+        self.placeholder_pixmap = QPixmap(*self.thumbnail_size)
+        self.placeholder_pixmap.fill(Qt.lightGray)
+        self.thumb_pool.start(ThumbCachePruner())
+
+        # The grid cells are built once and refilled on every render instead of being recreated.
+        self.thumb_slots = []
+        self.visible_slots = {}
+        for index in range(self.images_per_page):
+            thumbnail_label = ThumbLabel()
+            thumbnail_label.setFixedSize(*self.thumbnail_size)
+            thumbnail_label.clicked.connect(self.thumbnail_clicked)
+
+            # The hover darkening is a stylesheet rule on the overlay, so Qt handles it without Python callbacks.
+            overlay_label = QLabel(thumbnail_label)
+            overlay_label.setObjectName("reidThumbOverlay")
+            overlay_label.setAttribute(Qt.WA_Hover)
+            overlay_label.setFixedSize(*self.thumbnail_size)
+
+            container_widget = QWidget()
+            container_layout = QVBoxLayout(container_widget)
+            container_layout.setContentsMargins(0, 0, 0, 0)
+            container_layout.addWidget(thumbnail_label, alignment=Qt.AlignCenter)
+            container_widget.setVisible(False)
+
+            self.thumbnail_layout.addWidget(container_widget, index // 5, index % 5, alignment=Qt.AlignCenter)
+            self.thumb_slots.append(ThumbSlot(container_widget, thumbnail_label, overlay_label))
 
         self.selected_images = set()
         self.select_all_checkbox = None
@@ -98,6 +369,18 @@ class ReIDDatabase(QWidget):
 
         self.pagination_layout.addWidget(self.prev_button, alignment=Qt.AlignCenter)
         self.pagination_layout.addWidget(self.first_button, alignment=Qt.AlignCenter)
+
+        # Page number buttons are created once and relabelled on navigation.
+        self.max_visible_pages = 5
+        self.page_buttons = []
+        for _ in range(self.max_visible_pages):
+            page_button = QPushButton()
+            page_button.setFixedSize(40, 30)
+            page_button.clicked.connect(lambda _, b=page_button: self.go_to_page(b.property('page')))
+            page_button.setVisible(False)
+            self.page_buttons.append(page_button)
+            self.pagination_layout.addWidget(page_button, alignment=Qt.AlignCenter)
+
         self.pagination_layout.addWidget(self.last_button, alignment=Qt.AlignCenter)
         self.pagination_layout.addWidget(self.next_button, alignment=Qt.AlignCenter)
 
@@ -111,77 +394,136 @@ class ReIDDatabase(QWidget):
         self.setLayout(self.layout)
 
         self.images = []
-        self.images_per_page = 10
         self.current_page = 0
-        self.total_pages = max(1, (len(self.images) + self.images_per_page -1) // self.images_per_page)
+        self.recompute_total_pages()
         self.populate_tree()
         self.tw.itemClicked.connect(self.tree_click)
+        self.tw.itemExpanded.connect(self.tree_expanded)
 
     def update_image_grid(self):
         """
         Updates the thumbnail display grid to show images corresponding to
         the current page.
         """
-        while self.thumbnail_layout.count():
-            item = self.thumbnail_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-
         start_index = self.current_page * self.images_per_page
-        end_index = min(start_index + self.images_per_page, len(self.images))
+        page_images = self.images[start_index:start_index + self.images_per_page]
+
+        # Drop decodes still queued for a page that is no longer shown.
+        self.thumb_pool.clear()
+        self.loading_thumbs = set()
 
-        row = 0
-        col = 0
+        # Bind the lookups used for every thumbnail once, outside the loop.
+        visible_slots = {}
+        visible_thumbs = {}
+        thumbnail_pixmap = self.thumbnail_pixmap
+        selection_style = self.selection_style
+        for slot in self.thumb_slots[len(page_images):]:
+            slot.container.setVisible(False)
 
-        for i in range(start_index, end_index):
-            thumbnail_label = QLabel()
-            image_data = self.images[i]
+        for slot, image_data in zip(self.thumb_slots, page_images):
             thumbnail_path = image_data[4]
             reid_id = image_data[-1]
-            pixmap = QPixmap(thumbnail_path)
-            thumbnail_label.setPixmap(pixmap)
-            thumbnail_label.setFixedSize(*self.thumbnail_size)
+            thumbnail_label = slot.thumbnail_label
+            thumbnail_label.setPixmap(thumbnail_pixmap(thumbnail_path))
+            visible_thumbs.setdefault(thumbnail_path, []).append(thumbnail_label)
+            thumbnail_label.setStyleSheet(selection_style(reid_id))
+            thumbnail_label.payload = image_data
 
-            if reid_id in self.selected_images:
-                if self.in_delete_mode:
-                    thumbnail_label.setStyleSheet("border: 3px solid red;")
-                elif self.in_download_mode:
-                    thumbnail_label.setStyleSheet("border: 3px solid yellow;")
-            else:
-                thumbnail_label.setStyleSheet("border: none;")
+            visible_slots[reid_id] = slot
+            slot.container.setVisible(True)
 
-            overlay_label = QLabel(thumbnail_label)
-            overlay_label.setStyleSheet("background-color: rgba(0, 0, 0, 0);")
-            overlay_label.setFixedSize(*self.thumbnail_size)
+        self.visible_slots = visible_slots
+        self.visible_thumbs = visible_thumbs
+        self.update_pagination()
+        # Decode the neighbouring pages once this render has been painted.
+        QTimer.singleShot(0, self.prefetch_adjacent_pages)
 
-            def enter_event(event, lbl=overlay_label):
-                lbl.setStyleSheet("background-color: rgba(0, 0, 0, 0.4);")
+    def prefetch_adjacent_pages(self):
+        """
+        Queues the thumbnails of the previous and next pages for background decoding.
 
-            def leave_event(event, lbl=overlay_label):
-                lbl.setStyleSheet("background-color: rgba(0, 0, 0, 0);")
+        These are queued below the visible page, so they only use otherwise idle workers.
+        """
+        for page in (self.current_page + 1, self.current_page - 1):
+            if not 0 <= page < self.total_pages:
+                continue
+            start_index = page * self.images_per_page
+            for image_data in self.images[start_index:start_index + self.images_per_page]:
+                thumbnail_path = image_data[4]
+                if QPixmapCache.find(thumbnail_path) is None:
+                    self.queue_thumbnail(thumbnail_path, 0)
 
-            thumbnail_label.enterEvent = enter_event
-            thumbnail_label.leaveEvent = leave_event
+    def thumbnail_clicked(self, image):
+        """
+        Selects a clicked thumbnail in delete or download mode, otherwise opens it in a popup.
 
-            if self.in_delete_mode or self.in_download_mode:
-                thumbnail_label.mousePressEvent = lambda event, img_id=reid_id: self.toggle_image_selection(img_id)
-            else:
-                thumbnail_label.mousePressEvent = lambda event, image=image_data: self.open_image_popup(image)
+        Args:
+            image (tuple): The image data of the clicked thumbnail.
+        """
+        if self.in_delete_mode or self.in_download_mode:
+            self.toggle_image_selection(image[-1])
+        else:
+            self.open_image_popup(image)
 
-            container_widget = QWidget()
-            container_layout = QVBoxLayout(container_widget)
-            container_layout.setContentsMargins(0, 0, 0, 0)
-            container_layout.addWidget(thumbnail_label, alignment=Qt.AlignCenter)
+    def selection_style(self, reid_id):
+        """
+        Returns the border style of a thumbnail for its selection state and the current mode.
 
-            self.thumbnail_layout.addWidget(container_widget, row, col, alignment=Qt.AlignCenter)
+        Args:
+            reid_id (int): The ID of the REID result shown by the thumbnail.
+        """
+        if reid_id in self.selected_images:
+            if self.in_delete_mode:
+                return "border: 3px solid red;"
+            elif self.in_download_mode:
+                return "border: 3px solid yellow;"
+        return "border: none;"
 
-            col += 1
-            if col >= 5:
-                col = 0
-                row += 1
+    def thumbnail_pixmap(self, thumbnail_path):
+        """
+        Returns the cached thumbnail for a path, or the placeholder while it is decoded in the background.
 
-        self.update_pagination()
+        Later requests are given a higher priority so the page being viewed is decoded first.
+
+        Args:
+            thumbnail_path (str): The file path of the thumbnail image.
+        """
+        pixmap = QPixmapCache.find(thumbnail_path)
+        if pixmap is not None:
+            return pixmap
+
+        self.thumb_priority += 1
+        self.queue_thumbnail(thumbnail_path, self.thumb_priority)
+        return self.placeholder_pixmap
+
+    def queue_thumbnail(self, thumbnail_path, priority):
+        """
+        Starts decoding a thumbnail on the thumbnail pool unless it is already queued.
+
+        Args:
+            thumbnail_path (str): The file path of the thumbnail image.
+            priority (int): The pool priority; higher values are decoded first.
+        """
+        if thumbnail_path in self.loading_thumbs:
+            return
+        self.loading_thumbs.add(thumbnail_path)
+        loader = ThumbLoader(thumbnail_path, self.thumbnail_size)
+        loader.signals.done.connect(self.thumbnail_loaded)
+        self.thumb_pool.start(loader, priority)
+
+    def thumbnail_loaded(self, thumbnail_path, image):
+        """
+        Caches a thumbnail decoded by a ThumbLoader and shows it on any slot still displaying it.
+
+        Args:
+            thumbnail_path (str): The file path of the thumbnail image.
+            image (QImage): The decoded, scaled thumbnail.
+        """
+        self.loading_thumbs.discard(thumbnail_path)
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(thumbnail_path, pixmap)
+        for thumbnail_label in self.visible_thumbs.get(thumbnail_path, []):
+            thumbnail_label.setPixmap(pixmap)
 
     def toggle_select_all(self, state):
         """
@@ -192,8 +534,7 @@ class ReIDDatabase(QWidget):
             state (Qt.CheckState): The new state of the checkbox.
         """
         if state == Qt.Checked:
-            for image in self.images:
-                self.selected_images.add(image[-1])
+            self.selected_images = set(self.all_ids)
         else:
             self.selected_images.clear()
 
@@ -203,7 +544,9 @@ class ReIDDatabase(QWidget):
         if self.in_download_mode:
             self.confirm_download_button.setEnabled(bool(self.selected_images))
 
-        self.update_image_grid()
+        # Only the selection borders change, so restyle the visible thumbnails rather than re-rendering.
+        for reid_id, slot in self.visible_slots.items():
+            slot.thumbnail_label.setStyleSheet(self.selection_style(reid_id))
 
     def toggle_image_selection(self, image_id):
         """
@@ -217,7 +560,10 @@ class ReIDDatabase(QWidget):
         else:
             self.selected_images.add(image_id)
 
-        self.update_image_grid()
+        # Only the clicked thumbnail changes, so restyle it rather than re-rendering the grid.
+        slot = self.visible_slots.get(image_id)
+        if slot:
+            slot.thumbnail_label.setStyleSheet(self.selection_style(image_id))
 
         if self.in_delete_mode:
             self.confirm_delete_button.setEnabled(bool(self.selected_images))
@@ -325,17 +671,16 @@ class ReIDDatabase(QWidget):
                                                 f"Are you sure you want to delete {len(self.selected_images)} images from the ReID Database? The original photos will remain in local database",
                                                 QMessageBox.Yes | QMessageBox.No)
             if confirmation == QMessageBox.Yes:
-                deleted_images = []
-                for image_id in self.selected_images:
-                    database_helper.delete_reid(image_id)
-                    deleted_images.append(image_id)
+                deleted_images = set(self.selected_images)
+                database_helper.delete_reid_bulk(list(deleted_images))
 
                 self.selected_images.clear()
 
                 self.in_delete_mode = False
                 self.delete_button.setText("Delete Images")
                 self.remove_controls("delete")
-                self.images = [img for img in self.images if img[0] not in deleted_images]
+                self.images = [img for img in self.images if img[-1] not in deleted_images]
+                self.recompute_total_pages()
                 self.populate_tree()
                 self.clear_thumbnail_display()
                 self.download_button.setEnabled(True)
@@ -369,26 +714,18 @@ class ReIDDatabase(QWidget):
         if not zip_filename.endswith(".zip"):
             zip_filename += ".zip"
 
-        try:
-            with zipfile.ZipFile(zip_filename, 'w') as zipf:
-                for image_id in self.selected_images:
-                    image_data = database_helper.fetch_image_path_by_reid(image_id)
+        image_paths = database_helper.fetch_image_paths_by_reids(list(self.selected_images))
+        self.download_total = len(self.selected_images)
 
-                    if image_data is not None:
-                        bbox_image_path, crop_image_path, thumbnail_path = image_data
+        self.download_progress = QProgressDialog("Zipping images...", None, 0, len(image_paths), self)
+        self.download_progress.setWindowModality(Qt.WindowModal)
+        self.download_progress.show()
 
-                        if os.path.exists(bbox_image_path):
-                            zipf.write(bbox_image_path, os.path.basename(bbox_image_path))
-                        if os.path.exists(crop_image_path):
-                            zipf.write(crop_image_path, os.path.basename(crop_image_path))
-                        if os.path.exists(thumbnail_path):
-                            zipf.write(thumbnail_path, os.path.basename(thumbnail_path))
-
-            QMessageBox.information(self, "Download Complete",
-                                    f"{len(self.selected_images)} images have been zipped and saved successfully!")
-
-        except Exception as e:
-            QMessageBox.critical(self, "Download Error", f"An error occurred while creating the ZIP file: {str(e)}")
+        # The archive is written on a worker thread so the window stays responsive.
+        self.zip_writer = ZipWriter(zip_filename, image_paths)
+        self.zip_writer.signals.progress.connect(self.download_progress.setValue)
+        self.zip_writer.signals.finished.connect(self.finish_download)
+        QThreadPool.globalInstance().start(self.zip_writer)
 
         self.selected_images.clear()
         self.in_download_mode = False
@@ -400,43 +737,61 @@ class ReIDDatabase(QWidget):
         self.delete_button.setVisible(True)
         self.update_image_grid()
 
+    def finish_download(self, error):
+        """
+        Closes the download progress dialog and reports the result of writing the ZIP file.
+
+        Args:
+            error (str): The error message, or an empty string if the ZIP file was written successfully.
+        """
+        self.download_progress.close()
+        self.zip_writer = None
+        if error:
+            QMessageBox.critical(self, "Download Error", f"An error occurred while creating the ZIP file: {error}")
+        else:
+            QMessageBox.information(self, "Download Complete",
+                                    f"{self.download_total} images have been zipped and saved successfully!")
+
     def update_pagination(self):
         """
         Updates the pagination controls based on the current state of the images.
 
-        This method calculates the total number of pages and updates the navigation buttons
-        (first, previous, next, last) as well as the visible page numbers.
+        This method updates the navigation buttons (first, previous, next, last) and relabels
+        the pooled page number buttons for the pages around the current one.
         """
-        for i in reversed(range(self.pagination_layout.count())):
-            widget = self.pagination_layout.itemAt(i).widget()
-            if isinstance(widget, QPushButton) and widget not in [self.prev_button, self.next_button, self.last_button,
-                                                                  self.first_button]:
-                self.pagination_layout.removeWidget(widget)
-                widget.deleteLater()
-
-        total_pages = max(1, (len(self.images) + self.images_per_page - 1) // self.images_per_page)
+        total_pages = self.total_pages
 
         self.first_button.setEnabled(self.current_page > 0)
         self.prev_button.setEnabled(self.current_page > 0)
         self.next_button.setEnabled((self.current_page + 1) * self.images_per_page < len(self.images))
         self.last_button.setEnabled(self.current_page < total_pages - 1)
 
-        max_visible_pages = 5
+        max_visible_pages = self.max_visible_pages
         start_page = max(0, min(self.current_page - max_visible_pages // 2, total_pages - max_visible_pages))
         end_page = min(total_pages, start_page + max_visible_pages)
 
-        for page_num in range(start_page, end_page):
-            page_button = QPushButton(str(page_num + 1))
-            page_button.setFixedSize(40, 30)
+        for index, page_button in enumerate(self.page_buttons):
+            page_num = start_page + index
+            if page_num >= end_page:
+                page_button.setVisible(False)
+                continue
+            page_button.setText(str(page_num + 1))
+            page_button.setProperty('page', page_num)
 
-            if page_num == self.current_page:
-                page_button.setObjectName("selectedPageButton")
-            else:
-                page_button.setObjectName("unselectedPageButton")
+            object_name = "selectedPageButton" if page_num == self.current_page else "unselectedPageButton"
+            if page_button.objectName() != object_name:
+                # The stylesheet selects on object name, so re-polish when it changes.
+                page_button.setObjectName(object_name)
+                page_button.style().unpolish(page_button)
+                page_button.style().polish(page_button)
+            page_button.setVisible(True)
 
-            page_button.clicked.connect(lambda _, p=page_num: self.go_to_page(p))
-            self.pagination_layout.insertWidget(self.pagination_layout.count() - 2, page_button,
-                                                alignment=Qt.AlignCenter)
+    def recompute_total_pages(self):
+        """
+        Recomputes the number of pages and the set of REID IDs after the displayed images change.
+        """
+        self.total_pages = max(1, (len(self.images) + self.images_per_page - 1) // self.images_per_page)
+        self.all_ids = frozenset(image[-1] for image in self.images)
 
     def open_image_popup(self, image):
         """
@@ -491,8 +846,7 @@ class ReIDDatabase(QWidget):
         """
         Navigates to the last page of the image gallery.
         """
-        total_pages = max(1, (len(self.images) + self.images_per_page - 1) // self.images_per_page)
-        self.go_to_page(total_pages - 1)
+        self.go_to_page(self.total_pages - 1)
 
     def go_to_first_page(self):
         """Navigates to the first page of the image gallery and updates the display.
@@ -516,7 +870,7 @@ class ReIDDatabase(QWidget):
         If the page number is out of range, it displays a warning message.
         """
         try:
-            total_pages = max(1, (len(self.images) + self.images_per_page - 1) // self.images_per_page)
+            total_pages = self.total_pages
 
             if 0 <= page_num < total_pages:
                 self.current_page = page_num
@@ -549,16 +903,35 @@ class ReIDDatabase(QWidget):
     def populate_tree(self):
         """Populates the tree widget with images organized by date.
 
-        This method clears the existing tree and fetches the REID IDs grouped by date from the database.
-        It then creates top-level items for each date and child items for each REID ID under the corresponding date.
+        This method clears the existing tree and creates a top-level item for each REID run date.
+        The REID IDs under a date are only loaded when it is first expanded.
+        """
+        # Build the items first and insert them in one batch, without a repaint or signal per item.
+        date_items = []
+        for date in database_helper.get_reid_dates():
+            top_directory = QTreeWidgetItem([date])
+            top_directory.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+            date_items.append(top_directory)
+
+        self.tw.setUpdatesEnabled(False)
+        self.tw.blockSignals(True)
+        try:
+            self.tw.clear()
+            self.tw.addTopLevelItems(date_items)
+        finally:
+            self.tw.blockSignals(False)
+            self.tw.setUpdatesEnabled(True)
+
+    def tree_expanded(self, item):
+        """Loads the REID IDs of a date the first time it is expanded.
+
+        Args:
+            item (QTreeWidgetItem): The item that was expanded.
         """
-        self.tw.clear()
-        for date, ids in database_helper.get_reid_id_by_date().items():
-            top_directory = QTreeWidgetItem(self.tw)
-            top_directory.setText(0, date)
-            for id in ids:
-                id_item = QTreeWidgetItem(top_directory)
-                id_item.setText(0, id)
+        if item.parent() is not None or item.childCount():
+            return
+        item.addChildren([QTreeWidgetItem([id]) for id in database_helper.get_reid_ids_for_date(item.text(0))])
+        item.setChildIndicatorPolicy(QTreeWidgetItem.DontShowIndicatorWhenChildless)
 
     def tree_click(self, item, column):
         """Handles click events on the tree widget items.
@@ -586,7 +959,7 @@ class ReIDDatabase(QWidget):
 
         self.images = images_list
         self.current_page = 0
-        self.total_pages = max(1, (len(self.images) + self.images_per_page -1) // self.images_per_page)
+        self.recompute_total_pages()
         self.update_image_grid()
         self.download_button.setEnabled(True)
         self.delete_button.setEnabled(True)
@@ -597,20 +970,16 @@ class ReIDDatabase(QWidget):
         This method reads a CSS file located in the 'css' directory and applies the styles to the
         current widget, enhancing the visual appearance of the interface.
         """
-        css_file = os.path.join(os.path.dirname(__file__), 'css', 'reid_page.css')
-        with open(css_file, 'r') as f:
-            self.setStyleSheet(f.read())
+        self.setStyleSheet(load_reid_css())
 
     def clear_thumbnail_display(self):
         """Clears the thumbnail display area.
 
-        This method removes all thumbnails from the thumbnail layout by iterating through its items
-        and deleting them. It ensures that the display area is empty and ready for new thumbnails.
+        This method hides every thumbnail slot so the display area is empty and ready for new
+        thumbnails.
         """
-        while self.thumbnail_layout.count():
-            item = self.thumbnail_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
+        for slot in self.thumb_slots:
+            slot.container.setVisible(False)
+        self.visible_slots = {}
 
 
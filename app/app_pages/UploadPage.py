@@ -1,31 +1,100 @@
-import multiprocessing
-from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
-from PyQt5.QtWidgets import QApplication, QSpacerItem, QFrame, QSizePolicy, QHBoxLayout, QDialog, QWidget, QVBoxLayout, \
+from PyQt5.QtWidgets import QSpacerItem, QFrame, QSizePolicy, QHBoxLayout, QDialog, QWidget, QVBoxLayout, \
     QLabel, QPushButton, QFileDialog, QProgressBar, QMessageBox, QGridLayout
-from PyQt5.QtCore import Qt, pyqtSignal, QThread
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import Qt, pyqtSignal, QThread, QObject, QRunnable, QThreadPool
+from PyQt5.QtGui import QPixmap, QPixmapCache, QImage, QImageReader
 from datetime import datetime
 
+import hashlib
 import os
 import zipfile
 import cv2
 import time
 
-from app.detection_model.detection import main as detection_main
+from app.detection_model.detection import detect_images, get_model
 from app.util.generate_thumbnail import generate_thumbnail
 from app.util.database_helper import DatabaseHelper
 from app.app_pages.MapPopup import MapPopup
 from app.databases import conn
 
-# Determine the number of CPU cores and set maximum workers for image processing
-num_cores = multiprocessing.cpu_count()
-if num_cores > 1:
-    max_workers = num_cores // 2
-else:
-    max_workers = 1
+# An image picked for upload, before detection has run.
+UploadedImage = namedtuple("UploadedImage", "image_path group_name")
+# A detected image. group_name carries the animal label appended to the upload group, which is also kept
+# split out as group and animal so saving does not have to parse it again.
+ProcessedImage = namedtuple("ProcessedImage", "bbox_image_path crop_image_path confidence group_name group animal")
 
-def process_image_func(index, image_path, temp_images_dir, group_name, user):
+# File extensions accepted as uploads, compared against the lowercased text after the last dot.
+IMAGE_EXTENSIONS = frozenset({'png', 'jpg', 'jpeg'})
+
+# A reusable grid cell holding one thumbnail and its hover overlay.
+ThumbSlot = namedtuple("ThumbSlot", "container thumbnail_label overlay_label")
+
+# Encoder settings for the saved bbox and crop images; the photos tolerate a lower quality than OpenCV's default of 95.
+JPEG_WRITE_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 85, cv2.IMWRITE_JPEG_OPTIMIZE, 1]
+
+# Number of images passed to the detection model per call.
+BATCH_SIZE = 8
+# Images are decoded up to two batches ahead of the one being run through the model.
+DECODE_AHEAD = BATCH_SIZE * 3
+# Number of decoded thumbnails kept in memory for page navigation.
+PIXMAP_CACHE_SIZE = 200
+# Uploads this small are processed inline, as starting the IO pools would cost more than it saves.
+SMALL_UPLOAD_SIZE = 2
+
+def scan_image_folders(folder):
+    """
+    Walk a folder tree top-down, yielding the image files found directly in each directory.
+
+    Uses os.scandir so file types come from the directory listing rather than a stat per file.
+
+    Args:
+        folder (str): The root folder to search.
+
+    Yields:
+        tuple: The directory path and a list of the image file paths directly inside it.
+    """
+    pending = [folder]
+    while pending:
+        directory = pending.pop()
+        image_paths = []
+        subdirectories = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectories.append(entry.path)
+                    elif entry.is_file() and entry.name.rpartition('.')[2].lower() in IMAGE_EXTENSIONS:
+                        image_paths.append(entry.path)
+        except OSError as e:
+            print(f"Error reading folder {directory}: {e}")
+            continue
+        yield directory, image_paths
+        pending.extend(reversed(subdirectories))
+
+def io_worker_count(pending):
+    """
+    Return the number of threads to use for image IO.
+
+    OpenCV releases the GIL while decoding and encoding, so IO scales with the CPU count. The default
+    of one thread per core can be overridden with the CARE_MAX_WORKERS environment variable, and no
+    more threads are started than there are images to process.
+
+    Args:
+        pending (int): The number of images waiting to be processed.
+
+    Returns:
+        int: The number of worker threads.
+    """
+    try:
+        max_workers = int(os.environ.get('CARE_MAX_WORKERS', os.cpu_count() or 1))
+    except ValueError:
+        print("CARE_MAX_WORKERS must be an integer, using the CPU count instead.")
+        max_workers = os.cpu_count() or 1
+    return max(1, min(pending, max_workers))
+
+def process_image_func(index, image_path, temp_images_dir, group_name, user, upload_date=None):
     """
     Process a single image for object detection and save results.
 
@@ -35,42 +104,65 @@ def process_image_func(index, image_path, temp_images_dir, group_name, user):
         temp_images_dir (str): The directory to store temporary images.
         group_name (str): The group name associated with the images.
         user (str): The user requesting the processing.
+        upload_date (str): The timestamp used in the saved file names. Defaults to the current time.
 
     Returns:
-        tuple: A tuple containing paths to the bounding box image and cropped image, confidence score,
-               and updated group name. Returns None if the image cannot be processed.
+        ProcessedImage: The paths to the bounding box and cropped images, the confidence score and the group.
+            Returns None if the image cannot be processed.
     """
     loaded_image = cv2.imread(image_path)
-    image_filename = os.path.basename(image_path)
-    image_name, _ = os.path.splitext(image_filename)
     if loaded_image is None:
         return None
 
-    result = detection_main([loaded_image])
-    if not result:
+    detection = detect_images([loaded_image])[0]
+    if detection is None:
         return None
 
-    bbox_image, crop_image, label, confidence = result[0]
-    #user = "TestUser"
-    upload_date = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return save_detection(image_path, detection, temp_images_dir, group_name, user, upload_date)
+
+def save_detection(image_path, detection, temp_images_dir, group_name, user, upload_date=None):
+    """
+    Save the bounding box image, cropped image and thumbnail for a detected image.
+
+    Args:
+        image_path (str): The path to the original image file.
+        detection (tuple): The (bbox_image, crop_image, label, confidence) returned by the detection model.
+        temp_images_dir (str): The directory to store temporary images.
+        group_name (str): The group name associated with the image.
+        user (str): The user requesting the processing.
+        upload_date (str): The timestamp used in the saved file names. Defaults to the current time.
+
+    Returns:
+        ProcessedImage: The paths to the bounding box and cropped images, the confidence score and the group.
+    """
+    image_filename = os.path.basename(image_path)
+    image_name, _ = os.path.splitext(image_filename)
+
+    bbox_image, crop_image, label, confidence = detection
+    if upload_date is None:
+        upload_date = datetime.now().strftime("%Y%m%d_%H%M%S")
     confidence_str = f"{confidence:.3f}"
+    # Every image in a run shares upload_date and camera trap folders reuse names such as IMG_0001.JPG, so a
+    # short hash of the source path keeps same-named images from different folders apart. It goes before the
+    # image name, which the online sync reads from after the last underscore.
+    source_hash = hashlib.sha1(os.path.abspath(image_path).encode()).hexdigest()[:8]
 
-    bbox_image_path = os.path.join(temp_images_dir, 'bbox_images', f"bbox_{user}_{upload_date}_{confidence_str}_{image_name}.jpg")
-    crop_image_path = os.path.join(temp_images_dir, 'crop_images', f"crop_{user}_{upload_date}_{confidence_str}_{image_name}.jpg")
+    bbox_image_path = os.path.join(temp_images_dir, 'bbox_images',
+                                   f"bbox_{user}_{upload_date}_{confidence_str}_{source_hash}_{image_name}.jpg")
+    crop_image_path = os.path.join(temp_images_dir, 'crop_images',
+                                   f"crop_{user}_{upload_date}_{confidence_str}_{source_hash}_{image_name}.jpg")
 
-    cv2.imwrite(bbox_image_path, bbox_image)
-    cv2.imwrite(crop_image_path, crop_image)
+    cv2.imwrite(bbox_image_path, bbox_image, JPEG_WRITE_PARAMS)
+    cv2.imwrite(crop_image_path, crop_image, JPEG_WRITE_PARAMS)
 
     thumbnail_dir = os.path.join(temp_images_dir, 'thumbnails')
     thumbnail_path = generate_thumbnail(bbox_image_path, thumbnail_dir)
 
-    group_name = group_name + " " + label
-
-    return bbox_image_path, crop_image_path, confidence, group_name
+    return ProcessedImage(bbox_image_path, crop_image_path, confidence, group_name + " " + label, group_name, label)
 
 class ImageProcessingWorker(QThread):
     """
-    A worker class for processing images in a separate thread using a process pool.
+    A worker class for processing images in a separate thread, running detection in batches.
 
     Signals:
         progress (int, str): Emitted to indicate processing progress with current count and estimated time remaining.
@@ -92,6 +184,7 @@ class ImageProcessingWorker(QThread):
         self.temp_images_dir = temp_images_dir  # Directory for temporary images
         self.processed_images = []
         self.start_time = None  # To record the start time of processing
+        self.last_progress_emit = 0.0  # When progress was last sent to the GUI thread
         self.current_user = user
 
     def run(self):
@@ -100,25 +193,177 @@ class ImageProcessingWorker(QThread):
         This method will be called when the thread starts.
         """
         self.start_time = time.time()
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            futures = []
-            for index, (image_path, _, _, group_name) in enumerate(self.images):
-                futures.append(executor.submit(process_image_func, index, image_path, self.temp_images_dir, group_name, self.current_user))
-
-            for i, future in enumerate(futures):
-                result = future.result()
-                if result:
-                    self.processed_images.append(result)
-                elapsed_time = time.time() - self.start_time
-                images_processed = i + 1
-                avg_time_per_image = elapsed_time / images_processed
-                remaining_time = avg_time_per_image * (len(self.images) - images_processed)
-                remaining_time_str = f"Processing image {images_processed} of {len(self.images)}. Estimated remaining time: {int(remaining_time // 60)}m {int(remaining_time % 60)}s"
-                self.progress.emit(i + 1, remaining_time_str)
+        # Every image in a run shares one timestamp in its file names.
+        self.upload_date = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if len(self.images) <= SMALL_UPLOAD_SIZE:
+            self.process_inline()
+        else:
+            self.process_pipelined()
 
         self.result_ready.emit(self.processed_images)
         self.processing_complete.emit()
 
+    def process_inline(self):
+        """
+        Process each image in turn on the worker thread, without starting any pools.
+        """
+        for index, image in enumerate(self.images):
+            result = process_image_func(index, image.image_path, self.temp_images_dir, image.group_name,
+                                        self.current_user, self.upload_date)
+            if result:
+                self.processed_images.append(result)
+            self.emit_progress(index + 1)
+
+    def process_pipelined(self):
+        """
+        Process the images in batches, decoding and writing on thread pools alongside detection.
+        """
+        images_processed = 0
+        image_paths = [image.image_path for image in self.images]
+        workers = io_worker_count(len(image_paths))
+
+        # Decoding and writing run on their own pools so the model is not left waiting on disk.
+        with ThreadPoolExecutor(max_workers=workers) as decode_executor, \
+                ThreadPoolExecutor(max_workers=workers) as write_executor:
+            # Load the model while the first batch is being decoded.
+            write_executor.submit(get_model)
+
+            decodes = deque()
+            next_decode = 0
+            writes = []
+            for start in range(0, len(self.images), BATCH_SIZE):
+                while next_decode < min(len(image_paths), start + DECODE_AHEAD):
+                    decodes.append(decode_executor.submit(cv2.imread, image_paths[next_decode]))
+                    next_decode += 1
+
+                batch = self.images[start:start + BATCH_SIZE]
+                loaded_images = [decodes.popleft().result() for _ in batch]
+
+                # Run the model once for every image in the batch that could be read.
+                detections = iter(detect_images([image for image in loaded_images if image is not None]))
+
+                for image, loaded_image in zip(batch, loaded_images):
+                    detection = next(detections) if loaded_image is not None else None
+                    if detection is not None:
+                        writes.append(write_executor.submit(save_detection, image.image_path, detection,
+                                                            self.temp_images_dir, image.group_name, self.current_user,
+                                                            self.upload_date))
+                    images_processed += 1
+                    self.emit_progress(images_processed)
+
+            self.processed_images.extend(write.result() for write in writes)
+
+    def emit_progress(self, images_processed):
+        """
+        Emit the progress signal with an estimate of the remaining processing time.
+
+        Updates are limited to ten a second, plus the final one, so large uploads do not flood the
+        GUI thread with progress bar repaints.
+
+        Args:
+            images_processed (int): The number of images processed so far.
+        """
+        total_images = len(self.images)
+        now = time.monotonic()
+        if now - self.last_progress_emit < 0.1 and images_processed < total_images:
+            return
+        self.last_progress_emit = now
+
+        elapsed_time = time.time() - self.start_time
+        avg_time_per_image = elapsed_time / images_processed
+        remaining_time = avg_time_per_image * (total_images - images_processed)
+        remaining_time_str = f"Processing image {images_processed} of {total_images}. Estimated remaining time: {int(remaining_time // 60)}m {int(remaining_time % 60)}s"
+        self.progress.emit(images_processed, remaining_time_str)
+
+
+class ThumbnailGeneratorSignals(QObject):
+    """
+    Signals emitted by a ThumbnailGenerator, which cannot emit signals itself as a QRunnable.
+
+    Signals:
+        finished (str, str): Emitted with the source image path and the generated thumbnail path.
+    """
+    finished = pyqtSignal(str, str)
+
+
+class ThumbnailGenerator(QRunnable):
+    """
+    Generates the thumbnail of an uploaded image on a worker thread.
+
+    Args:
+        image_path (str): The path to the source image.
+        thumbnail_dir (str): The directory to write the thumbnail to.
+    """
+    def __init__(self, image_path, thumbnail_dir):
+        super().__init__()
+        self.image_path = image_path
+        self.thumbnail_dir = thumbnail_dir
+        self.signals = ThumbnailGeneratorSignals()
+
+    def run(self):
+        """
+        Generate the thumbnail and emit its path.
+        """
+        try:
+            thumbnail_path = generate_thumbnail(self.image_path, self.thumbnail_dir)
+        except Exception as e:
+            print(f"Error generating thumbnail for {self.image_path}: {e}")
+            return
+        self.signals.finished.emit(self.image_path, thumbnail_path)
+
+
+class PopupImageLoaderSignals(QObject):
+    """
+    Signals emitted by a PopupImageLoader, which cannot emit signals itself as a QRunnable.
+
+    Signals:
+        done (str, QImage): Emitted with the cache key and the decoded, scaled image.
+    """
+    done = pyqtSignal(str, QImage)
+
+
+class PopupImageLoader(QRunnable):
+    """
+    Decodes a full-size image at the image popup's size on a worker thread.
+
+    QPixmap may only be used on the GUI thread, so the worker produces a QImage which the
+    page converts once it arrives.
+
+    Args:
+        image_path (str): The path to the image to display.
+        cache_key (str): The QPixmapCache key the scaled image is stored under.
+        width (int): The width to fit the image into.
+        height (int): The height to fit the image into.
+    """
+    def __init__(self, image_path, cache_key, width, height):
+        super().__init__()
+        self.image_path = image_path
+        self.cache_key = cache_key
+        self.width = width
+        self.height = height
+        self.signals = PopupImageLoaderSignals()
+
+    def run(self):
+        """
+        Decode the image at the popup size and emit it.
+
+        Asking the reader for the target size lets the JPEG decoder downsample while decoding, instead of
+        allocating the full-resolution image only to shrink it afterwards.
+        """
+        reader = QImageReader(self.image_path)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid():
+            size.scale(self.width, self.height, Qt.KeepAspectRatio)
+            reader.setScaledSize(size)
+        image = reader.read()
+        if image.isNull():
+            print(f"Error loading image {self.image_path}: {reader.errorString()}")
+            return
+        if not size.isValid():
+            image = image.scaled(self.width, self.height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.signals.done.emit(self.cache_key, image)
+
 
 class UploadPage(QWidget):
     """
@@ -155,13 +400,16 @@ class UploadPage(QWidget):
 
         self.upload_button = QPushButton("Upload Images")
         self.upload_button.setObjectName("uploadButtonProcess")
-        self.upload_button.setFixedSize(self.upload_button.sizeHint().width() + 80, self.upload_button.sizeHint().height() + 20)
+        # The action buttons are all sized from the upload button's size hint, so query it only once.
+        upload_hint = self.upload_button.sizeHint()
+        button_width, button_height = upload_hint.width() + 80, upload_hint.height() + 20
+        self.upload_button.setFixedSize(button_width, button_height)
         self.upload_button.clicked.connect(self.upload_images)
         upload_button_layout.addWidget(self.upload_button)
 
         self.clear_upload_button = QPushButton("Clear Images")
         self.clear_upload_button.setObjectName("clearUploadButton")
-        self.clear_upload_button.setFixedSize(self.upload_button.sizeHint().width() + 80, self.upload_button.sizeHint().height() + 20)
+        self.clear_upload_button.setFixedSize(button_width, button_height)
         self.clear_upload_button.clicked.connect(self.clear_uploaded_images)
         upload_button_layout.addWidget(self.clear_upload_button)
 
@@ -174,7 +422,7 @@ class UploadPage(QWidget):
 
         self.process_button = QPushButton("Process Images")
         self.process_button.setObjectName("processButton")
-        self.process_button.setFixedSize(self.upload_button.sizeHint().width() + 80, self.upload_button.sizeHint().height() + 20)
+        self.process_button.setFixedSize(button_width, button_height)
         self.process_button.clicked.connect(self.process_images)
         self.process_button.setEnabled(False)
         self.UploadPage_layout.addWidget(self.process_button, alignment=Qt.AlignCenter)
@@ -196,19 +444,50 @@ class UploadPage(QWidget):
         self.thumbnail_size = (150, 150)
         self.images_per_page = 10
 
+        # The grid cells are built once and refilled on every page instead of being recreated.
+        self.thumb_slots = []
+        for index in range(self.images_per_page):
+            thumbnail_label = QLabel()
+            thumbnail_label.setFixedSize(*self.thumbnail_size)
+
+            overlay_label = QLabel(thumbnail_label)
+            overlay_label.setStyleSheet("background-color: rgba(0, 0, 0, 0);")
+            overlay_label.setFixedSize(*self.thumbnail_size)
+
+            def enter_event(event, lbl=overlay_label):
+                lbl.setStyleSheet("background-color: rgba(0, 0, 0, 0.4);")
+
+            def leave_event(event, lbl=overlay_label):
+                lbl.setStyleSheet("background-color: rgba(0, 0, 0, 0);")
+
+            thumbnail_label.enterEvent = enter_event
+            thumbnail_label.leaveEvent = leave_event
+
+            container_widget = QWidget()
+            container_layout = QVBoxLayout(container_widget)
+            container_layout.setContentsMargins(0, 0, 0, 0)
+            container_layout.addWidget(thumbnail_label, alignment=Qt.AlignCenter)
+            container_widget.setVisible(False)
+
+            self.thumbnail_layout.addWidget(container_widget, index // 5, index % 5)
+            self.thumb_slots.append(ThumbSlot(container_widget, thumbnail_label, overlay_label))
+
         self.save_button = QPushButton("Save Images to Database")
         self.save_button.setObjectName("saveButton")
-        self.save_button.setFixedSize(self.upload_button.sizeHint().width() + 100,
-                                      self.upload_button.sizeHint().height() + 20)
+        self.save_button.setFixedSize(upload_hint.width() + 100, button_height)
         self.save_button.clicked.connect(self.save_images_to_database)
         self.save_button.setEnabled(False)
         self.UploadPage_layout.addWidget(self.save_button, alignment=Qt.AlignCenter)
 
-        self.pagination_layout = QHBoxLayout()
+        # The pagination controls share one container so they can be shown or hidden together.
+        self.pagination_widget = QWidget()
+        self.pagination_layout = QHBoxLayout(self.pagination_widget)
+        self.pagination_layout.setContentsMargins(0, 0, 0, 0)
 
         self.prev_button = QPushButton("Previous")
         self.prev_button.setObjectName("prevButton")
-        self.prev_button.setFixedSize(self.prev_button.sizeHint().width() + 20, self.prev_button.sizeHint().height() + 10)
+        prev_hint = self.prev_button.sizeHint()
+        self.prev_button.setFixedSize(prev_hint.width() + 20, prev_hint.height() + 10)
         self.prev_button.clicked.connect(self.prev_page)
 
         self.first_button = QPushButton("«")
@@ -223,11 +502,24 @@ class UploadPage(QWidget):
 
         self.next_button = QPushButton("Next")
         self.next_button.setObjectName("nextButton")
-        self.next_button.setFixedSize(self.next_button.sizeHint().width() + 20, self.next_button.sizeHint().height() + 10)
+        next_hint = self.next_button.sizeHint()
+        self.next_button.setFixedSize(next_hint.width() + 20, next_hint.height() + 10)
         self.next_button.clicked.connect(self.next_page)
 
         self.pagination_layout.addWidget(self.prev_button, alignment=Qt.AlignCenter)
         self.pagination_layout.addWidget(self.first_button, alignment=Qt.AlignCenter)
+
+        # Page number buttons are created once and relabelled on navigation.
+        self.max_visible_pages = 5
+        self.page_buttons = []
+        for _ in range(self.max_visible_pages):
+            page_button = QPushButton()
+            page_button.setFixedSize(40, 30)
+            page_button.clicked.connect(lambda _, b=page_button: self.go_to_page(b.property('page')))
+            page_button.setVisible(False)
+            self.page_buttons.append(page_button)
+            self.pagination_layout.addWidget(page_button, alignment=Qt.AlignCenter)
+
         self.pagination_layout.addWidget(self.last_button, alignment=Qt.AlignCenter)
         self.pagination_layout.addWidget(self.next_button, alignment=Qt.AlignCenter)
 
@@ -236,7 +528,7 @@ class UploadPage(QWidget):
         self.next_button.setEnabled(False)
         self.last_button.setEnabled(False)
 
-        self.UploadPage_layout.addLayout(self.pagination_layout)
+        self.UploadPage_layout.addWidget(self.pagination_widget)
 
 
 
@@ -249,6 +541,7 @@ class UploadPage(QWidget):
 
         self.images = []
         self.processed_images = []
+        self.images_by_group = {}
         self.group_data = []
 
         self.current_page = 0
@@ -256,6 +549,17 @@ class UploadPage(QWidget):
         self.thumbnail_size = (150, 150)
 
         self.image_list = []
+        self.recompute_total_pages()
+        self.pixmap_cache = OrderedDict()
+
+        # Missing thumbnails are generated in the background while a grey placeholder is shown.
+        self.thumb_pool = QThreadPool.globalInstance()
+        self.generating_thumbnails = set()
+        # File names in the thumbnail folder, listed lazily so page turns need no stat per thumbnail.
+        self.known_thumbnails = None
+        self.visible_thumbnail_labels = {}
+        self.placeholder_pixmap = QPixmap(*self.thumbnail_size)
+        self.placeholder_pixmap.fill(Qt.lightGray)
 
         self.update_button_states('upload')
 
@@ -283,30 +587,25 @@ class UploadPage(QWidget):
         folder = QFileDialog.getExistingDirectory(self, "Select Folder with Images")
 
         if folder:
-            image_extensions = ['.png', '.jpg', '.jpeg']
             new_images = []
 
-            for root, dirs, files in os.walk(folder):
+            for root, image_paths in scan_image_folders(folder):
+                if not image_paths:
+                    continue
 
                 folder_name = os.path.basename(root)
                 current_datetime = datetime.now().strftime('%Y%m%d_%H%M%S')
                 group_name = f'{folder_name}_{current_datetime}'
-                images_in_folder = 0 
 
-                for file in files:
-                    if os.path.splitext(file)[1].lower() in image_extensions:
-                        image_path = os.path.join(root, file)
-                        new_images.append((image_path, None, None, group_name))
-                        images_in_folder += 1
-                
-                if images_in_folder > 0:
-                    self.group_data.append(group_name)
+                new_images.extend(UploadedImage(image_path, group_name) for image_path in image_paths)
+                self.group_data.append(group_name)
 
             if not new_images:
                 QMessageBox.warning(self, "No Images Found", "The selected folder does not contain any image files.")
                 return
 
             self.image_list.extend(new_images)
+            self.recompute_total_pages()
 
             self.clear_thumbnails()
             self.update_thumbnails()
@@ -328,7 +627,9 @@ class UploadPage(QWidget):
 
         if confirmation == QMessageBox.Yes:
             self.image_list = []
+            self.recompute_total_pages()
             self.group_data = []
+            self.pixmap_cache.clear()
             self.clear_thumbnails()
             self.clear_upload_button.setEnabled(False)
             self.upload_button.setText("Upload Images")
@@ -350,11 +651,8 @@ class UploadPage(QWidget):
         if not self.image_list:
             QMessageBox.warning(self, "No Images", "Please upload images before processing...")
             return
-        
-        for i in range(self.pagination_layout.count()):
-                widget = self.pagination_layout.itemAt(i).widget()
-                if widget is not None:
-                    widget.setVisible(False)
+
+        self.pagination_widget.setVisible(False)
 
         self.progress_bar.setVisible(True)
         self.progress_bar.setMaximum(len(self.image_list))
@@ -397,6 +695,9 @@ class UploadPage(QWidget):
         """
         self.processed_images = processed_images
         self.image_list = self.processed_images
+        # The worker wrote thumbnails for every detection, so list the folder again.
+        self.known_thumbnails = None
+        self.recompute_total_pages()
         self.update_thumbnails()
 
     def on_processing_complete(self):
@@ -407,6 +708,12 @@ class UploadPage(QWidget):
         If no images were processed, it allows for new uploads; otherwise, it prepares to save the images.
         """
         self.progress_bar.setVisible(False)
+
+        # Index the processed images by upload group once, for the per-group save steps.
+        self.images_by_group = {}
+        for image in self.processed_images:
+            self.images_by_group.setdefault(image.group, []).append(image)
+
         if not self.processed_images:
             self.update_button_states('upload')
         else:
@@ -438,7 +745,7 @@ class UploadPage(QWidget):
         """
         while self.current_group_index < len(self.group_data):
             group_name = self.group_data[self.current_group_index]
-            group_images = [image for image in self.processed_images if image[3].rsplit(' ',1)[0] == group_name]
+            group_images = self.images_by_group.get(group_name, [])
 
             if group_images:
                 map_view = MapPopup(group_name)
@@ -450,12 +757,13 @@ class UploadPage(QWidget):
 
         self.images_saved_signal.emit()
         self.clear_thumbnails()
-        self.processed_images.clear()
-        self.group_data.clear()
-        self.update_pagination()
         self.save_button.setEnabled(False)
         QMessageBox.information(self, "Save Complete", "Processed images have been saved to the local database.")
         self.show_download_popup()
+        self.processed_images.clear()
+        self.recompute_total_pages()
+        self.group_data.clear()
+        self.update_pagination()
         self.upload_button.setText("Upload Images")
         self.update_button_states('upload')
     
@@ -469,15 +777,18 @@ class UploadPage(QWidget):
         thumbnail_dir = os.path.join(self.temp_images_dir, 'thumbnails')
         group_name = self.group_data[self.current_group_index]
 
-        group_images = [image for image in self.processed_images if image[3].rsplit(' ',1)[0] == group_name]
+        group_images = self.images_by_group.get(group_name, [])
+
+        user = self.current_user
+        location_str = str(location)
+        upload_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        rows = []
+        for image in group_images:
+            thumbnail_path = os.path.join(thumbnail_dir, os.path.basename(image.bbox_image_path))
+            rows.append((user, image.bbox_image_path, image.crop_image_path, thumbnail_path, location_str, upload_date, image.confidence, image.group, image.animal))
 
-        for bbox_image_path, crop_image_path, confidence, group_name in group_images:
-            thumbnail_path = os.path.join(thumbnail_dir, os.path.basename(bbox_image_path))
-            user = self.current_user
-            location_str = str(location)
-            upload_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            group_name_cleaned, animal = group_name.rsplit(' ', 1)
-            self.db_helper.insert_image(user, bbox_image_path, crop_image_path, thumbnail_path, location_str, upload_date, confidence, group_name_cleaned, animal)
+        # Insert the whole group in one transaction rather than committing once per image.
+        self.db_helper.insert_images_bulk(rows)
 
         self.current_group_index += 1
         self.process_next_group()
@@ -512,117 +823,151 @@ class UploadPage(QWidget):
 
         if folder:
             zip_path = os.path.join(folder, "processed_images.zip")
-            with zipfile.ZipFile(zip_path, 'w') as zip_file:
-                for image_path, _ in self.processed_images:
-                    zip_file.write(image_path, os.path.basename(image_path))
+            # The images are already compressed JPEGs, so store them rather than deflating again.
+            with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_STORED) as zip_file:
+                for image in self.processed_images:
+                    zip_file.write(image.bbox_image_path, os.path.basename(image.bbox_image_path))
+                    zip_file.write(image.crop_image_path, os.path.basename(image.crop_image_path))
             QMessageBox.information(self, "Download Complete", f"Processed images have been saved to {zip_path}.")
 
     def update_thumbnails(self):
         """
         Updates the displayed thumbnails of images based on the current pagination state.
 
-        Clears any existing thumbnails and retrieves a new set of images to display based on the
-        current page and the number of images allowed per page. It generates and displays
-        thumbnails for the images in the specified range.
+        Refills the pooled thumbnail slots with the images of the current page and hides any
+        slots left over. Missing thumbnails are generated in the background.
 
-        Thumbnails include hover effects and are wrapped in a container for layout management.
         Pagination is updated accordingly after loading the thumbnails.
         """
-        self.clear_thumbnails()
-
         start_index = self.current_page * self.images_per_page
-        end_index = min(start_index + self.images_per_page, len(self.image_list))
-
-        row, col = 0, 0
+        page_images = self.image_list[start_index:start_index + self.images_per_page]
         thumbnail_dir = os.path.join(self.temp_images_dir, 'thumbnails')
 
-        for i in range(start_index, end_index):
-            image_path, _, _, _ = self.image_list[i]
-            thumbnail_path = os.path.join(thumbnail_dir, os.path.basename(image_path))
-
-            if not os.path.exists(thumbnail_path):
-                thumbnail_path = generate_thumbnail(image_path, thumbnail_dir)
-
-            thumbnail_label = QLabel()
-            pixmap = QPixmap(thumbnail_path)
-            thumbnail_label.setPixmap(pixmap)
-            thumbnail_label.setFixedSize(*self.thumbnail_size)
+        self.visible_thumbnail_labels = {}
+        if self.known_thumbnails is None:
+            self.known_thumbnails = set(os.listdir(thumbnail_dir)) if os.path.isdir(thumbnail_dir) else set()
+        for slot in self.thumb_slots[len(page_images):]:
+            slot.container.setVisible(False)
+
+        for slot, image in zip(self.thumb_slots, page_images):
+            # Both uploaded and processed images lead with the path of the image to show.
+            image_path = image[0]
+            thumbnail_name = os.path.basename(image_path)
+            thumbnail_path = os.path.join(thumbnail_dir, thumbnail_name)
+
+            thumbnail_label = slot.thumbnail_label
+            if thumbnail_name in self.known_thumbnails:
+                thumbnail_label.setPixmap(self.thumbnail_pixmap(thumbnail_path))
+            else:
+                thumbnail_label.setPixmap(self.placeholder_pixmap)
+                self.visible_thumbnail_labels[image_path] = thumbnail_label
+                self.queue_thumbnail(image_path, thumbnail_dir)
             thumbnail_label.mousePressEvent = lambda event, path=image_path: self.open_image_popup(path)
+            slot.container.setVisible(True)
 
-            overlay_label = QLabel(thumbnail_label)
-            overlay_label.setStyleSheet("background-color: rgba(0, 0, 0, 0);")
-            overlay_label.setFixedSize(*self.thumbnail_size)
-
-            def enter_event(event, lbl=overlay_label):
-                lbl.setStyleSheet("background-color: rgba(0, 0, 0, 0.4);")
+        self.update_pagination()
 
-            def leave_event(event, lbl=overlay_label):
-                lbl.setStyleSheet("background-color: rgba(0, 0, 0, 0);")
+    def queue_thumbnail(self, image_path, thumbnail_dir):
+        """
+        Starts generating the thumbnail of an image in the background unless it is already being generated.
 
-            thumbnail_label.enterEvent = enter_event
-            thumbnail_label.leaveEvent = leave_event
+        Args:
+            image_path (str): The path to the source image.
+            thumbnail_dir (str): The directory to write the thumbnail to.
+        """
+        if image_path in self.generating_thumbnails:
+            return
+        self.generating_thumbnails.add(image_path)
+        generator = ThumbnailGenerator(image_path, thumbnail_dir)
+        generator.signals.finished.connect(self.thumbnail_generated)
+        self.thumb_pool.start(generator)
 
-            container_widget = QWidget()
-            container_layout = QVBoxLayout(container_widget)
-            container_layout.setContentsMargins(0, 0, 0, 0)
+    def thumbnail_generated(self, image_path, thumbnail_path):
+        """
+        Shows a newly generated thumbnail if its image is still on the current page.
 
-            container_layout.addWidget(thumbnail_label, alignment=Qt.AlignCenter)
+        Args:
+            image_path (str): The path to the source image.
+            thumbnail_path (str): The path to the generated thumbnail.
+        """
+        self.generating_thumbnails.discard(image_path)
+        if self.known_thumbnails is not None:
+            self.known_thumbnails.add(os.path.basename(thumbnail_path))
+        # The file was just (re)written, so any pixmap cached under this path is stale.
+        self.pixmap_cache.pop(thumbnail_path, None)
+        thumbnail_label = self.visible_thumbnail_labels.pop(image_path, None)
+        if thumbnail_label is not None:
+            thumbnail_label.setPixmap(self.thumbnail_pixmap(thumbnail_path))
+
+    def thumbnail_pixmap(self, thumbnail_path):
+        """
+        Returns the pixmap for a thumbnail, decoding it only if it is not among the recently used ones.
 
-            self.thumbnail_layout.addWidget(container_widget, row, col)
-            col += 1
-            if col >= 5:
-                col = 0
-                row += 1
+        Args:
+            thumbnail_path (str): The path to the thumbnail image.
 
-        self.update_pagination()
+        Returns:
+            QPixmap: The decoded thumbnail.
+        """
+        pixmap = self.pixmap_cache.get(thumbnail_path)
+        if pixmap is None:
+            pixmap = QPixmap(thumbnail_path)
+            self.pixmap_cache[thumbnail_path] = pixmap
+            if len(self.pixmap_cache) > PIXMAP_CACHE_SIZE:
+                self.pixmap_cache.popitem(last=False)
+        else:
+            self.pixmap_cache.move_to_end(thumbnail_path)
+        return pixmap
 
     def update_pagination(self):
         """
         Updates the pagination controls based on the current page state and total number of images.
 
         This method enables or disables pagination buttons (first, previous, next, last) based on
-        the current page and total pages calculated from the total number of images. It dynamically
-        creates page number buttons for quick navigation and updates their visual state based on the
-        current selection.
+        the current page and the cached total number of pages. It relabels the pooled page number
+        buttons for quick navigation and updates their visual state based on the current selection.
         """
-        for i in reversed(range(self.pagination_layout.count())):
-            widget = self.pagination_layout.itemAt(i).widget()
-            if isinstance(widget, QPushButton) and widget not in [self.prev_button, self.next_button, self.last_button, self.first_button]:
-                self.pagination_layout.removeWidget(widget)
-                widget.deleteLater()
-
-        total_pages = max(1, (len(self.image_list) + self.images_per_page - 1) // self.images_per_page)
+        total_pages = self.total_pages
 
         self.first_button.setEnabled(self.current_page > 0)
         self.prev_button.setEnabled(self.current_page > 0)
         self.next_button.setEnabled((self.current_page + 1) * self.images_per_page < len(self.image_list))
         self.last_button.setEnabled(self.current_page < total_pages - 1)
 
-        max_visible_pages = 5
+        max_visible_pages = self.max_visible_pages
         start_page = max(0, min(self.current_page - max_visible_pages // 2, total_pages - max_visible_pages))
         end_page = min(total_pages, start_page + max_visible_pages)
 
-        for page_num in range(start_page, end_page):
-            page_button = QPushButton(str(page_num + 1))
-            page_button.setFixedSize(40, 30)
-
-            if page_num == self.current_page:
-                page_button.setObjectName("selectedPageButton")
-            else:
-                page_button.setObjectName("unselectedPageButton")
-
-            page_button.clicked.connect(lambda _, p=page_num: self.go_to_page(p))
-            self.pagination_layout.insertWidget(self.pagination_layout.count() - 2, page_button, alignment=Qt.AlignCenter)
+        for index, page_button in enumerate(self.page_buttons):
+            page_num = start_page + index
+            if page_num >= end_page:
+                page_button.setVisible(False)
+                continue
+            page_button.setText(str(page_num + 1))
+            page_button.setProperty('page', page_num)
+
+            object_name = "selectedPageButton" if page_num == self.current_page else "unselectedPageButton"
+            if page_button.objectName() != object_name:
+                # The stylesheet selects on object name, so re-polish when it changes.
+                page_button.setObjectName(object_name)
+                page_button.style().unpolish(page_button)
+                page_button.style().polish(page_button)
+            page_button.setVisible(True)
+
+    def recompute_total_pages(self):
+        """
+        Recomputes the number of pages after the list of images changes.
+        """
+        self.total_pages = max(1, (len(self.image_list) + self.images_per_page - 1) // self.images_per_page)
 
     def go_to_last_page(self):
         """
         Navigates the view to the last page of images.
 
-        Calculates the total number of pages and invokes the go_to_page() method to
+        Uses the cached total number of pages and invokes the go_to_page() method to
         set the current page to the last one.
         """
-        total_pages = max(1, (len(self.image_list) + self.images_per_page - 1) // self.images_per_page)
-        self.go_to_page(total_pages - 1)
+        self.go_to_page(self.total_pages - 1)
 
     def go_to_first_page(self):
         """
@@ -647,7 +992,7 @@ class UploadPage(QWidget):
             ValueError: If page_num is not a valid page index.
         """
         try:
-            total_pages = max(1, (len(self.image_list) + self.images_per_page - 1) // self.images_per_page)
+            total_pages = self.total_pages
 
             if 0 <= page_num < total_pages:
                 self.current_page = page_num
@@ -661,16 +1006,11 @@ class UploadPage(QWidget):
         """
         Clears all currently displayed thumbnails from the layout.
 
-        Iterates through the thumbnail layout and deletes all thumbnail widgets, freeing memory.
-        After clearing, it processes events to update the UI.
+        Hides every thumbnail slot; Qt repaints the frame on its next pass through the event loop.
         """
-        while self.thumbnail_layout.count():
-            item = self.thumbnail_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-
-        QApplication.processEvents()
+        self.visible_thumbnail_labels = {}
+        for slot in self.thumb_slots:
+            slot.container.setVisible(False)
     
     def clear_non_detected_thumbnails(self, thumbnail_dir):
         """
@@ -681,6 +1021,8 @@ class UploadPage(QWidget):
         Args:
             thumbnail_dir (str): The directory containing thumbnails to clear.
         """
+        self.known_thumbnails = None
+        self.pixmap_cache.clear()
         for file_name in os.listdir(thumbnail_dir):
             if not file_name.startswith("bbox_"):
                 file_path = os.path.join(thumbnail_dir, file_name)
@@ -724,13 +1066,44 @@ class UploadPage(QWidget):
 
         layout = QVBoxLayout(popup)
         image_label = QLabel(popup)
-        pixmap = QPixmap(image_path)
-        image_label.setPixmap(pixmap.scaled(popup.width(), popup.height(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        image_label.setAlignment(Qt.AlignCenter)
+
+        width, height = popup.width(), popup.height()
+        cache_key = f"{image_path}:{width}x{height}"
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is not None:
+            image_label.setPixmap(pixmap)
+        else:
+            # Decode off the GUI thread so the popup opens straight away, showing the grid thumbnail
+            # enlarged in the meantime when it is already in memory.
+            thumbnail_path = os.path.join(self.temp_images_dir, 'thumbnails', os.path.basename(image_path))
+            thumbnail = self.pixmap_cache.get(thumbnail_path)
+            if thumbnail is not None:
+                image_label.setPixmap(thumbnail.scaled(width, height, Qt.KeepAspectRatio, Qt.FastTransformation))
+            else:
+                image_label.setText("Loading...")
+            loader = PopupImageLoader(image_path, cache_key, width, height)
+            loader.signals.done.connect(
+                lambda key, image: self.popup_image_loaded(image_label, key, image))
+            self.thumb_pool.start(loader, 1)
 
         layout.addWidget(image_label)
         popup.setLayout(layout)
         popup.show()
 
+    def popup_image_loaded(self, image_label, cache_key, image):
+        """
+        Shows a popup image once its background decode finishes and caches the result.
+
+        Args:
+            image_label (QLabel): The popup label to show the image in.
+            cache_key (str): The QPixmapCache key for the scaled image.
+            image (QImage): The decoded, scaled image.
+        """
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(cache_key, pixmap)
+        image_label.setPixmap(pixmap)
+
     def update_button_states(self, stage):
         """
         Updates the states of various buttons based on the current stage of the image processing workflow.
@@ -771,10 +1144,8 @@ class UploadPage(QWidget):
             self.clear_upload_button.setEnabled(False)
             self.upload_button.setText("Upload More Images")
 
-            for i in range(self.pagination_layout.count()):
-                widget = self.pagination_layout.itemAt(i).widget()
-                if widget is not None:
-                    widget.setVisible(True)
+            self.update_pagination()
+            self.pagination_widget.setVisible(True)
 
             self.process_button.setEnabled(False)
             self.save_button.setEnabled(True)
@@ -1,16 +1,202 @@
-from PyQt5.QtGui import QStandardItemModel, QStandardItem
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QMessageBox, QTableView, QAbstractItemView, \
     QHeaderView, QTableWidgetItem, QInputDialog, QComboBox
-from PyQt5.QtCore import QSettings, pyqtSignal, Qt
+from PyQt5.QtCore import QSettings, pyqtSignal, Qt, QAbstractTableModel, QModelIndex, QTimer
 import os
+from functools import lru_cache
 
-from app.databases.conn import OnlineDatabase
+from app.databases.conn import get_online_database
 from app.util.network_manager import NetworkManager
 from app.util.user_database_helper import UserDatabaseHelper
 check_network = NetworkManager()
-connection = OnlineDatabase()
+connection = get_online_database()
 local_connection = UserDatabaseHelper()
 
+USER_TABLE_HEADERS = ["Email Address", "Creation Date", "Username", "Is Authorized", "Is Admin"]
+AUTHORISED_COLUMN = USER_TABLE_HEADERS.index("Is Authorized")
+# Display strings for boolean columns, indexed by the flag itself.
+YES_NO = ("No", "Yes")
+# Authorised status passed to load_users for each filter combo box entry; None loads every user.
+USER_FILTERS = [None, True, False]
+# Number of users fetched from the database each time the table is scrolled to the bottom.
+USER_PAGE_SIZE = 100
+# Delay before a filter change is applied, so stepping through the combo box only queries once.
+FILTER_DEBOUNCE_MS = 150
+
+
+@lru_cache(maxsize=1)
+def load_user_profile_css():
+    """
+    Reads the user profile stylesheet, which is only read from disk once per run.
+
+    Returns:
+        str: The contents of user_profile.css.
+    """
+    css_file = os.path.join(os.path.dirname(__file__), 'css', 'user_profile.css')
+    with open(css_file, 'r') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def is_admin(database_connection, username):
+    """
+    Checks whether a user is an admin, remembering the answer for the rest of the session.
+
+    Args:
+        database_connection: The online or local user database to ask.
+        username (str): The email of the user to check.
+
+    Returns:
+        bool: True if the user is an admin, False otherwise.
+    """
+    return bool(database_connection.check_admin_status(username))
+
+
+class UserTableModel(QAbstractTableModel):
+    """
+    A read-only table model backed by one list of pre-formatted display strings per column.
+
+    The strings are built once when the users are loaded, so painting a cell is two list lookups rather than
+    a QStandardItem allocation or a strftime call. Keeping the columns as separate lists avoids a tuple per
+    row and lets a single cell be replaced in place. When given a page loader, the model fetches further
+    pages as the view scrolls to the bottom.
+
+    Attributes:
+        columns (tuple): One list of display strings per column of USER_TABLE_HEADERS.
+        load_page (callable): Returns the page of users after a given user id, or None for a fixed list.
+        last_user_id (int): The id of the last user loaded, where the next page continues from.
+        has_more (bool): Whether another page may be available.
+    """
+
+    def __init__(self, parent=None):
+        """
+        Initializes the UserTableModel with no rows.
+
+        Args:
+            parent (QObject, optional): The parent object of the model.
+        """
+        super().__init__(parent)
+        self.columns = tuple([] for _ in USER_TABLE_HEADERS)
+        self.load_page = None
+        self.last_user_id = None
+        self.has_more = False
+
+    @staticmethod
+    def format_user(user):
+        """
+        Builds the display row for a user.
+
+        Args:
+            user: The user object to format.
+
+        Returns:
+            tuple: The email, creation date, username, authorised and admin strings of the user.
+        """
+        return (
+            user.email,
+            user.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+            user.username,
+            YES_NO[bool(user.is_authorised)],
+            YES_NO[bool(user.is_admin)],
+        )
+
+    def set_users(self, users, load_page=None):
+        """
+        Replaces the rows of the model with the given users, skipping admin accounts.
+
+        Args:
+            users (list): A list of user objects to be displayed in the table.
+            load_page (callable, optional): Called with the id of the last loaded user to fetch the next page
+                of USER_PAGE_SIZE users. Without it, users is treated as the complete list.
+        """
+        self.beginResetModel()
+        self.columns = tuple([] for _ in USER_TABLE_HEADERS)
+        self.extend_columns([user for user in users if not user.is_admin])
+        self.load_page = load_page
+        self.last_user_id = users[-1].id if users else None
+        self.has_more = load_page is not None and len(users) == USER_PAGE_SIZE
+        self.endResetModel()
+
+    def extend_columns(self, users):
+        """
+        Appends the display strings of the given users to the column lists.
+
+        Args:
+            users (list): The user objects to append.
+        """
+        rows = [self.format_user(user) for user in users]
+        for column, values in zip(self.columns, zip(*rows)):
+            column.extend(values)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        """Returns whether another page of users may be available."""
+        return not parent.isValid() and self.has_more
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Appends the next page of users to the model."""
+        if parent.isValid() or not self.has_more:
+            return
+        users = self.load_page(self.last_user_id)
+        self.has_more = len(users) == USER_PAGE_SIZE
+        if not users:
+            return
+        self.last_user_id = users[-1].id
+        new_users = [user for user in users if not user.is_admin]
+        if not new_users:
+            return
+        first_row = self.rowCount()
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(new_users) - 1)
+        self.extend_columns(new_users)
+        self.endInsertRows()
+
+    def email_at(self, row):
+        """
+        Returns the email address shown in the given row.
+
+        Args:
+            row (int): The row index.
+
+        Returns:
+            str: The email address of the user in that row.
+        """
+        return self.columns[0][row]
+
+    def update_row(self, row, column, value):
+        """
+        Replaces one cell and repaints it, without resetting the model.
+
+        Args:
+            row (int): The row index.
+            column (int): The column index.
+            value (str): The new display string.
+        """
+        self.columns[column][row] = value
+        index = self.index(row, column)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def rowCount(self, parent=QModelIndex()):
+        """Returns the number of users in the model."""
+        if parent.isValid():
+            return 0
+        return len(self.columns[0])
+
+    def columnCount(self, parent=QModelIndex()):
+        """Returns the number of columns in the model."""
+        if parent.isValid():
+            return 0
+        return len(USER_TABLE_HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Returns the display string for a cell; every other role is left to the view's defaults."""
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self.columns[index.column()][index.row()]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Returns the column titles for the horizontal header."""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return USER_TABLE_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
 
 class UserProfile(QWidget):
     """
@@ -36,161 +222,93 @@ class UserProfile(QWidget):
             username (str): The username of the logged-in user.
         """
         super().__init__()
+        self.load_stylesheet()
         self.UserProfile_layout = QVBoxLayout()
         self.username = username
 
+        self.database_connection = connection if check_network.is_online() else local_connection
+
         # Check if the user is an admin
-        if check_network.is_online():
-            self.database_connection = connection
-            if self.database_connection.check_admin_status(username):
-                self.init_admin_view()
-            else:
-                self.init_user_view()
+        if is_admin(self.database_connection, username):
+            self.init_admin_view()
         else:
-            self.database_connection = local_connection
-            if self.database_connection.check_admin_status(username):
-                self.init_admin_view()
-            else:
-                self.init_user_view()
+            self.init_user_view()
 
     def init_admin_view(self):
         """Initializes the user interface for admin users."""
         # Title label
         title_label = QLabel("User Management")
         title_label.setObjectName("titleLabel")
-        title_label.setStyleSheet("""
-            font-size: 28px; 
-            font-weight: bold; 
-            margin-bottom: 20px; 
-            color: #2C3E50;
-        """)
         self.UserProfile_layout.addWidget(title_label)
 
         self.filterComboBox = QComboBox()
+        self.filterComboBox.setObjectName("userFilterComboBox")
         self.filterComboBox.addItem("All Users")
         self.filterComboBox.addItem("Authorised Users")
         self.filterComboBox.addItem("Unauthorised Users")
-        self.filterComboBox.setStyleSheet("""
-            font-size: 16px; 
-            padding: 10px; 
-            margin-bottom: 20px; 
-            border: 1px solid #BDC3C7; 
-            border-radius: 5px; 
-        """)
-        self.filterComboBox.currentIndexChanged.connect(self.apply_filter)
+        self.applied_filter_index = -1
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self.filter_timer.timeout.connect(self.apply_filter)
+        self.filterComboBox.currentIndexChanged.connect(lambda index: self.filter_timer.start())
         self.UserProfile_layout.addWidget(self.filterComboBox)
 
-        self.userTableModel = QStandardItemModel()
-        self.userTableModel.setHorizontalHeaderLabels(
-            ["Email Address", "Creation Date", "Username", "Is Authorized", "Is Admin"]
-        )
+        self.userTableModel = UserTableModel(self)
         self.userTableView = QTableView()
+        self.userTableView.setObjectName("userTableView")
         self.userTableView.setModel(self.userTableModel)
         self.userTableView.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.userTableView.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.userTableView.setStyleSheet("""
-            font-size: 14px; 
-            background-color: #ECF0F1; 
-            border-radius: 5px; 
-            color: black;
-        """)
         self.UserProfile_layout.addWidget(self.userTableView)
 
         self.approveButton = QPushButton("Approve")
+        self.approveButton.setObjectName("approveButton")
         self.rejectButton = QPushButton("Reject")
+        self.rejectButton.setObjectName("rejectButton")
         self.approveButton.clicked.connect(self.approve_user)
         self.rejectButton.clicked.connect(self.reject_user)
 
-        # Button styles
-        self.approveButton.setStyleSheet("""
-            background-color: #27AE60; 
-            color: white; 
-            font-size: 16px; 
-            margin: 5px; 
-            padding: 10px; 
-            border: none; 
-            border-radius: 5px; 
-        """)
-        self.rejectButton.setStyleSheet("""
-            background-color: #C0392B; 
-            color: white; 
-            font-size: 16px; 
-            margin: 5px; 
-            padding: 10px; 
-            border: none; 
-            border-radius: 5px; 
-        """)
-
-        # Button hover effect
-        self.approveButton.setStyleSheet("""
-            background-color: #27AE60; 
-            color: white; 
-            font-size: 16px; 
-            margin: 5px; 
-            padding: 10px; 
-            border: none; 
-            border-radius: 5px; 
-        """)
-        self.rejectButton.setStyleSheet("""
-            background-color: #C0392B; 
-            color: white; 
-            font-size: 16px; 
-            margin: 5px; 
-            padding: 10px; 
-            border: none; 
-            border-radius: 5px; 
-        """)
-
         self.UserProfile_layout.addWidget(self.approveButton)
         self.UserProfile_layout.addWidget(self.rejectButton)
 
         # Sign Out Button
-        self.sign_out_button = QPushButton("Sign Out")
-        self.sign_out_button.setObjectName("signOutButton")
-        self.sign_out_button.setFixedSize(self.sign_out_button.sizeHint().width() + 50,
-                                          self.sign_out_button.sizeHint().height() + 10)  # Add padding
-        self.sign_out_button.setStyleSheet("""
-            background-color: #E67E22; 
-            color: white; 
-            font-size: 14px; 
-            margin: 5px;
-            padding: 10px; 
-            border: none; 
-            border-radius: 5px; 
-        """)
+        self.sign_out_button = self.create_sign_out_button("adminSignOutButton")
         self.UserProfile_layout.addWidget(self.sign_out_button, alignment=Qt.AlignCenter)
 
-        self.sign_out_button.clicked.connect(self.handle_sign_out)
-
         self.setLayout(self.UserProfile_layout)
         self.apply_filter()  # Load users initially
 
     def init_user_view(self):
         """Initializes the user interface for regular users."""
         # Initialization code for normal user view (not an admin)
-        self.load_stylesheet()
         label = QLabel("User Profile")
         label.setObjectName("profileLabel")
-        label.setStyleSheet("""
-            font-size: 28px; 
-            font-weight: bold; 
-            margin-bottom: 20px; 
-            color: #2C3E50;
-        """)
         self.UserProfile_layout.addWidget(label)
 
         # Sign Out Button
-        self.sign_out_button = QPushButton("Sign Out")
-        self.sign_out_button.setObjectName("signOutButton")
-        self.sign_out_button.setFixedSize(self.sign_out_button.sizeHint().width() + 50,
-                                          self.sign_out_button.sizeHint().height() + 10)  # Add padding
-
+        self.sign_out_button = self.create_sign_out_button("signOutButton")
         self.UserProfile_layout.addWidget(self.sign_out_button, alignment=Qt.AlignCenter)
 
-        self.sign_out_button.clicked.connect(self.handle_sign_out)
-
         self.setLayout(self.UserProfile_layout)
 
+    def create_sign_out_button(self, object_name):
+        """
+        Creates the sign-out button, padded around its size hint and connected to handle_sign_out.
+
+        Args:
+            object_name (str): The object name used to style the button.
+
+        Returns:
+            QPushButton: The sign-out button.
+        """
+        button = QPushButton("Sign Out")
+        button.setObjectName(object_name)
+        size_hint = button.sizeHint()
+        button.setFixedSize(size_hint.width() + 50, size_hint.height() + 10)  # Add padding
+        button.clicked.connect(self.handle_sign_out)
+        return button
+
     def load_user(self, users):
         """
         Loads the user data into the user table model.
@@ -198,67 +316,49 @@ class UserProfile(QWidget):
         Args:
             users (list): A list of user objects to be displayed in the table.
         """
-        all_users = users
-        self.userTableModel.clear()
-        self.userTableModel.setHorizontalHeaderLabels(
-            ["Email Address", "Creation Date", "Username", "Is Authorized", "Is Admin"]
-        )
-        for user in all_users:
-            if not user.is_admin:
-                is_authorised = "Yes" if user.is_authorised else "No"
-                is_admin = "Yes" if user.is_admin else "No"
-                created_at = user.created_at.strftime("%Y-%m-%d %H:%M:%S")
-                self.userTableModel.appendRow(
-                    [
-                        QStandardItem(user.email),
-                        QStandardItem(created_at),
-                        QStandardItem(user.username),
-                        QStandardItem(is_authorised),
-                        QStandardItem(is_admin)
-                    ]
-                )
+        self.userTableModel.set_users(users)
 
     def approve_user(self):
-        """Approves the selected user in the user table."""
-        selected_row = self.userTableView.currentIndex().row()
-        if selected_row < 0:
-            QMessageBox.warning(self, "Warning", "Please select a user to approve.")
-            return
-
-        email = self.userTableModel.item(selected_row, 0).text()
-        self.database_connection.approve_user(email)
-        self.apply_filter()
+        """Approves the selected users in the user table."""
+        self.set_selected_authorised(True, "approve")
 
     def reject_user(self):
-        """Rejects the selected user in the user table."""
-        selected_row = self.userTableView.currentIndex().row()
-        if selected_row < 0:
-            QMessageBox.warning(self, "Warning", "Please select a user to reject.")
-            return
-
-        email = self.userTableModel.item(selected_row, 0).text()
+        """Rejects the selected users in the user table."""
         #password, ok = QInputDialog.getText(self, "Admin Password", "Enter your admin password:", QLineEdit.Password)
         #if ok and password:  # Check if the password was entered
-        self.database_connection.reject_user(email)
-        self.apply_filter()
+        self.set_selected_authorised(False, "reject")
+
+    def set_selected_authorised(self, authorised, action):
+        """
+        Sets the authorised status of every selected user in one transaction and updates their rows in place.
+
+        Args:
+            authorised (bool): The authorised status to set.
+            action (str): The action name used in the warning shown when nothing is selected.
+        """
+        selected_rows = sorted(index.row() for index in self.userTableView.selectionModel().selectedRows())
+        if not selected_rows:
+            QMessageBox.warning(self, "Warning", f"Please select a user to {action}.")
+            return
+
+        emails = [self.userTableModel.email_at(row) for row in selected_rows]
+        self.database_connection.set_users_authorised(emails, authorised)
+        status = YES_NO[authorised]
+        for row in selected_rows:
+            self.userTableModel.update_row(row, AUTHORISED_COLUMN, status)
 
     def apply_filter(self):
-        """Applies the selected filter to the user list and reloads the user data."""
+        """Applies the selected filter to the user list and reloads the user data, unless it is already shown."""
         current_index = self.filterComboBox.currentIndex()
-        all_users = self.database_connection.load_all_users()
-        users = []
-        if current_index == 0:
-            return self.load_user(all_users)
-        elif current_index == 1:
-            for user in all_users:
-                if user.is_authorised:
-                    users.append(user)
-            self.load_user(users)
-        else:
-            for user in all_users:
-                if not user.is_authorised:
-                    users.append(user)
-            self.load_user(users)
+        if current_index == self.applied_filter_index:
+            return
+        self.applied_filter_index = current_index
+        authorised = USER_FILTERS[current_index]
+
+        def load_page(before_id=None):
+            return self.database_connection.load_users(authorised, USER_PAGE_SIZE, before_id)
+
+        self.userTableModel.set_users(load_page(), load_page)
 
     def handle_sign_out(self):
         """Handles the sign-out process for the user."""
@@ -276,6 +376,4 @@ class UserProfile(QWidget):
         """
         Loads the stylesheet from the specified CSS file and applies it to the widget.
         """
-        css_file = os.path.join(os.path.dirname(__file__), 'css', 'user_profile.css')
-        with open(css_file, 'r') as f:
-            self.setStyleSheet(f.read())
\ No newline at end of file
+        self.setStyleSheet(load_user_profile_css())
\ No newline at end of file
@@ -1,18 +1,87 @@
 import socket
 
 from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QLineEdit, QPushButton, QMessageBox, QHBoxLayout, QWidget
-from PyQt5.QtGui import QPixmap
-from PyQt5.QtCore import Qt, QTimer, QSettings
+from PyQt5.QtCore import Qt, QSettings, QThreadPool, QObject, QRunnable, pyqtSignal
+from PyQt5.QtNetwork import QNetworkConfigurationManager
 from app.app_windows.RegisterWindow import RegisterWindow
 import os
-from app.databases.conn import OnlineDatabase
-from app.util.network_manager import NetworkManager
+from functools import lru_cache
+from app.databases.conn import get_online_database
+from app.util.network_manager import NetworkManager, NetworkProbe
+from app.util.resource_cache import load_scaled_pixmap
 from app.util.user_database_helper import UserDatabaseHelper
 
 local_user_db = UserDatabaseHelper()
 
 connection = NetworkManager()
 
+
+@lru_cache(maxsize=1)
+def load_login_css():
+    """
+    Reads the login window stylesheet, which is only read from disk once per run.
+
+    Returns:
+        str: The contents of login_window.css.
+    """
+    css_file = os.path.join(os.path.dirname(__file__), 'css', 'login_window.css')
+    with open(css_file, 'r') as f:
+        return f.read()
+
+
+class LoginCheckSignals(QObject):
+    """
+    Signals emitted by a LoginCheck, which cannot emit signals itself as a QRunnable.
+
+    Signals:
+        finished (str, str): Emitted with the outcome ('success', 'unauthorised', 'wrong_password',
+            'missing', 'offline' or 'error') and the email of the user.
+    """
+    finished = pyqtSignal(str, str)
+
+
+class LoginCheck(QRunnable):
+    """
+    Looks up a user and verifies their password on a worker thread.
+
+    Password verification is a deliberately slow bcrypt check, so it is kept off the GUI thread.
+
+    Args:
+        user_db: The local or online user database to check against.
+        username (str): The email entered by the user.
+        password (str): The password entered by the user.
+        check_online (bool): Whether to check for an internet connection before looking the user up.
+    """
+    def __init__(self, user_db, username, password, check_online=False):
+        super().__init__()
+        self.user_db = user_db
+        self.username = username
+        self.password = password
+        self.check_online = check_online
+        self.signals = LoginCheckSignals()
+
+    def run(self):
+        """
+        Check the credentials and emit the outcome.
+        """
+        try:
+            if self.check_online and not connection.is_online():
+                self.signals.finished.emit('offline', self.username)
+                return
+            user = self.user_db.get_user(self.username)
+            if not user:
+                outcome = 'missing'
+            elif not user.is_authorised:
+                outcome = 'unauthorised'
+            elif user.check_password(self.password):
+                outcome = 'success'
+            else:
+                outcome = 'wrong_password'
+        except Exception as e:
+            print(f"Error checking login for {self.username}: {e}")
+            outcome = 'error'
+        self.signals.finished.emit(outcome, self.username)
+
 class LoginWindow(QDialog):
     """
     A dialog window for user login.
@@ -58,8 +127,8 @@ class LoginWindow(QDialog):
         # Logo at the top
         self.logo_label = QLabel(self)
         self.logo_label.setObjectName("image")
-        self.logo_pixmap = QPixmap('app/resources/icons/logo.png')
-        self.logo_label.setPixmap(self.logo_pixmap.scaled(200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        self.logo_pixmap = load_scaled_pixmap('app/resources/icons/logo.png', 200)
+        self.logo_label.setPixmap(self.logo_pixmap)
         self.layout.addWidget(self.logo_label, alignment=Qt.AlignCenter)
 
         self.layout.addSpacing(20)
@@ -110,15 +179,17 @@ class LoginWindow(QDialog):
         # Wifi Icon
         self.wifi_label = QLabel(self)
         self.wifi_label.setFixedSize(30,30)
+        self.online_pixmap = load_scaled_pixmap('app/resources/icons/online-icon.png', 30)
+        self.offline_pixmap = load_scaled_pixmap('app/resources/icons/offline-icon.png', 30)
+        self.set_wifi_icon(connection.last_known_status())
         self.update_wifi_icon()
         self.layout.addWidget(self.wifi_label, alignment=Qt.AlignCenter)
 
         self.layout.addSpacing(50)
 
-        # Timer for connectivity checks
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_wifi_icon)
-        self.timer.start(10000)
+        # Re-probe connectivity only when the system reports a network change
+        self.network_config_manager = QNetworkConfigurationManager(self)
+        self.network_config_manager.onlineStateChanged.connect(lambda online: self.update_wifi_icon())
 
         self.login_button.clicked.connect(self.handle_login)
         self.register_button.clicked.connect(self.open_register_window)
@@ -129,9 +200,7 @@ class LoginWindow(QDialog):
         """
         Loads the stylesheet from the specified CSS file and applies it to the dialog.
         """
-        css_file = os.path.join(os.path.dirname(__file__), 'css', 'login_window.css')
-        with open(css_file, 'r') as f:
-            self.setStyleSheet(f.read())
+        self.setStyleSheet(load_login_css())
 
     def handle_login(self):
         """
@@ -139,8 +208,8 @@ class LoginWindow(QDialog):
 
         This method retrieves the username and password from the input fields and checks
         the credentials against the local user database or online database, depending on
-        the application's configuration. It displays appropriate message boxes for success
-        or failure of the login attempt.
+        the application's configuration. The check runs as a LoginCheck on the global thread
+        pool, and login_checked displays the outcome once it finishes.
 
         Raises:
             Exception: If there is an issue during the login process.
@@ -149,40 +218,16 @@ class LoginWindow(QDialog):
         username = self.username_input.text()
         password = self.password_input.text()
         if not self.is_online_database:
-            local_user_db.login(username, password)
-            user = local_user_db.get_user(username)
-            if user:
-                if not user.is_authorised:
-                    QMessageBox.warning(self, 'Login Failed', 'You are not authorised. Ask admin for authorisation.')
-                elif user.check_password(password):
-                    QMessageBox.information(self, 'Login Success', f'Welcome, {username}')
-                    self.currentUser = user.email
-                    self.accept()
-                else:
-                    QMessageBox.warning(self, 'Login Failed', 'Incorrect username or password.')
-            else:
-                QMessageBox.warning(self, 'Login Failed', 'User does not exist.')
+            user_db = local_user_db
         else:
-            if not connection.is_online():
-                QMessageBox.warning(self, 'No Internet',
-                'You are not connected to the internet. Please connect and try again.')
-
-            else:
-                conn = OnlineDatabase()
-                user = conn.get_user(username)
-
-                if user:
-                    if not user.is_authorised:
-                        QMessageBox.warning(self, 'Login Failed', 'You are not authorised. Ask admin for authorisation.')
-                    elif user.check_password(password):
-                        QMessageBox.information(self, 'Login Success', f'Welcome, {username}')
-                        self.currentUser = user.email
-                        self.accept()
-                    else:
-                        QMessageBox.warning(self, 'Login Failed', 'Incorrect username or password.')
-                else:
-                    QMessageBox.warning(self, 'Login Failed', 'User does not exist.')
+            user_db = get_online_database()
 
+        self.login_button.setEnabled(False)
+        self.login_button.setText("Logging in...")
+        # The connectivity check can block on the network, so it runs with the rest of the check.
+        login_check = LoginCheck(user_db, username, password, check_online=bool(self.is_online_database))
+        login_check.signals.finished.connect(self.login_checked)
+        QThreadPool.globalInstance().start(login_check)
 
         '''user = self.user_db.get_user(username)
 
@@ -192,6 +237,32 @@ class LoginWindow(QDialog):
         else:
             QMessageBox.warning(self, "Error", "Incorrect username or password")'''
 
+    def login_checked(self, outcome, username):
+        """
+        Reports the result of a background login check and accepts the dialog on success.
+
+        Args:
+            outcome (str): The outcome emitted by LoginCheck.
+            username (str): The email the user logged in with.
+        """
+        self.login_button.setEnabled(True)
+        self.login_button.setText("Login")
+        if outcome == 'success':
+            QMessageBox.information(self, 'Login Success', f'Welcome, {username}')
+            self.currentUser = username
+            self.accept()
+        elif outcome == 'unauthorised':
+            QMessageBox.warning(self, 'Login Failed', 'You are not authorised. Ask admin for authorisation.')
+        elif outcome == 'wrong_password':
+            QMessageBox.warning(self, 'Login Failed', 'Incorrect username or password.')
+        elif outcome == 'missing':
+            QMessageBox.warning(self, 'Login Failed', 'User does not exist.')
+        elif outcome == 'offline':
+            QMessageBox.warning(self, 'No Internet',
+            'You are not connected to the internet. Please connect and try again.')
+        else:
+            QMessageBox.warning(self, 'Login Failed', 'Could not check your details. Please try again.')
+
     def open_register_window(self):
         """
         Opens the registration dialog.
@@ -211,12 +282,19 @@ class LoginWindow(QDialog):
         """
         Updates the wifi icon based on the connection status.
 
-        This method checks the current network status and updates the wifi icon displayed
-        in the dialog accordingly. If the application is online, an online icon is shown;
-        otherwise, an offline icon is displayed.
+        This method starts a network probe on the global thread pool; the wifi icon is
+        updated by set_wifi_icon once the probe reports back, so the dialog never blocks
+        on the network.
         """
-        if connection.is_online():
-            wifi_icon = QPixmap('app/resources/icons/online-icon.png')
-        else:
-            wifi_icon = QPixmap('app/resources/icons/offline-icon.png')
-        self.wifi_label.setPixmap(wifi_icon.scaled(30, 30, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        probe = NetworkProbe()
+        probe.signals.finished.connect(self.set_wifi_icon)
+        QThreadPool.globalInstance().start(probe)
+
+    def set_wifi_icon(self, online):
+        """
+        Shows the online or offline wifi icon.
+
+        Args:
+            online (bool): Whether the application is connected to the internet.
+        """
+        self.wifi_label.setPixmap(self.online_pixmap if online else self.offline_pixmap)
@@ -1,9 +1,9 @@
 import os
 import sys
+from functools import lru_cache
 from PyQt5.QtWidgets import QApplication, QMainWindow, QListWidget, QStackedWidget, QWidget, QLabel, QVBoxLayout, \
     QSplitter, QListWidgetItem, QPushButton, QMessageBox, QCheckBox
-from PyQt5.QtGui import QPixmap, QIcon
-from PyQt5.QtCore import Qt, QSettings, QProcess, QSize
+from PyQt5.QtCore import Qt, QSettings, QProcess, QSize, QObject, QRunnable, QThreadPool, pyqtSignal
 from app.app_pages.HomePage import HomePage
 from app.app_pages.UploadPage import UploadPage
 from app.app_pages.MapView import MapView
@@ -13,8 +13,58 @@ from app.app_pages.ReIDDatabase import ReIDDatabase
 from app.app_pages.UserProfile import UserProfile
 from app.util.database_helper import DatabaseHelper
 from app.util.network_manager import NetworkManager
-from app.databases.conn import OnlineDatabase
+from app.databases.conn import get_online_database
 from app.util.user_database_helper import UserDatabaseHelper
+from app.util.resource_cache import load_icon, load_scaled_pixmap
+
+
+@lru_cache(maxsize=1)
+def load_main_window_css():
+    """
+    Reads the main window stylesheet, which is only read from disk once per run.
+
+    Returns:
+        str: The contents of main_window.css.
+    """
+    css_file = os.path.join(os.path.dirname(__file__), 'css', 'main_window.css')
+    with open(css_file, 'r') as f:
+        return f.read()
+
+
+class DatabaseTaskSignals(QObject):
+    """
+    Signals emitted by a DatabaseTask, which cannot emit signals itself as a QRunnable.
+
+    Signals:
+        finished (object): Emitted with the value returned by the task's function.
+    """
+    finished = pyqtSignal(object)
+
+
+class DatabaseTask(QRunnable):
+    """
+    Runs a database call on a worker thread so a slow or unreachable server cannot freeze the window.
+
+    Args:
+        function (callable): The call to run, taking no arguments.
+    """
+    def __init__(self, function):
+        super().__init__()
+        self.function = function
+        self.signals = DatabaseTaskSignals()
+
+    def run(self):
+        """
+        Run the call and emit its result.
+        """
+        try:
+            result = self.function()
+        except Exception as e:
+            print(f"Error running database task: {e}")
+            return
+        self.signals.finished.emit(result)
+
+
 class MainWindow(QMainWindow):
     """
     Main window for the project CARE application.
@@ -36,6 +86,7 @@ class MainWindow(QMainWindow):
         self.local_db = DatabaseHelper()
         self.local_user_db = UserDatabaseHelper()
         self.app = app
+        self.settings = QSettings("YourCompany", "YourApp")
         self.setWindowTitle("project CARE")
         self.setGeometry(100, 100, 1180, 700)
 
@@ -51,21 +102,21 @@ class MainWindow(QMainWindow):
 
         self.logo_label = QLabel()
         self.logo_label.setObjectName("logoLabel")
-        self.logo_pixmap = QPixmap('app/resources/icons/logo.png')
-        self.logo_label.setPixmap(self.logo_pixmap.scaled(150, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        self.logo_pixmap = load_scaled_pixmap('app/resources/icons/logo.png', 150)
+        self.logo_label.setPixmap(self.logo_pixmap)
         self.sidebar_layout.addWidget(self.logo_label, alignment=Qt.AlignCenter)
 
         self.list_widget = QListWidget()
         self.sidebar_layout.addWidget(self.list_widget)
 
-        self.home_icon = QIcon('app/app_pages/resources/home.png')
-        self.upload_icon = QIcon('app/app_pages/resources/upload-big-arrow.png')
-        self.cloud_icon = QIcon('app/app_pages/resources/cloud-computing.png')
-        self.stoat_icon = QIcon('app/app_pages/resources/weasel.png')
-        self.map_icon = QIcon('app/app_pages/resources/pin.png')
-        self.database_icon = QIcon('app/app_pages/resources/database.png')
-        self.user_icon = QIcon('app/app_pages/resources/user.png')
-        self.arrow_icon = QIcon('app/app_pages/resources/left-arrow.png')
+        self.home_icon = load_icon('app/app_pages/resources/home.png')
+        self.upload_icon = load_icon('app/app_pages/resources/upload-big-arrow.png')
+        self.cloud_icon = load_icon('app/app_pages/resources/cloud-computing.png')
+        self.stoat_icon = load_icon('app/app_pages/resources/weasel.png')
+        self.map_icon = load_icon('app/app_pages/resources/pin.png')
+        self.database_icon = load_icon('app/app_pages/resources/database.png')
+        self.user_icon = load_icon('app/app_pages/resources/user.png')
+        self.arrow_icon = load_icon('app/app_pages/resources/left-arrow.png')
 
 
         self.tab1 = QListWidgetItem(self.home_icon, "Home")
@@ -82,6 +133,8 @@ class MainWindow(QMainWindow):
         self.list_widget.addItem(self.tab5)
         self.list_widget.addItem(self.tab6)
         self.list_widget.addItem(self.tab7)
+        self.tabs_by_label = {tab.text(): tab for tab in
+                              (self.tab1, self.tab2, self.tab3, self.tab4, self.tab5, self.tab6, self.tab7)}
 
         self.hide_tabs(["Online Database"], True)
 
@@ -90,18 +143,21 @@ class MainWindow(QMainWindow):
         self.online_database_toggle.setChecked(self.load_online_database_setting())
         self.online_database_toggle.setObjectName("onlineDatabaseToggle")
 
+        # Fills the gap left by the hidden Online Database tab. It is built once and only hidden or shown
+        # when the toggle changes, so the sidebar list is never restructured.
+        self.spacer_widget = QListWidgetItem()
+        spacer_widget = QWidget()
+        spacer_layout = QVBoxLayout(spacer_widget)
+        spacer_layout.addStretch()
+        self.spacer_widget.setSizeHint(QSize(100, 40))
+        self.list_widget.insertItem(7, self.spacer_widget)
+        self.list_widget.setItemWidget(self.spacer_widget, spacer_widget)
+
         if self.online_database_toggle.isChecked():
             self.online_database_toggle.setText("Online Database: On")
-            self.spacer_widget = None
+            self.spacer_widget.setHidden(True)
         else:
             self.online_database_toggle.setText("Online Database: Off")
-            self.spacer_widget = QListWidgetItem()
-            spacer_widget = QWidget()
-            spacer_layout = QVBoxLayout(spacer_widget)
-            spacer_layout.addStretch()
-            self.spacer_widget.setSizeHint(QSize(100, 40))
-            self.list_widget.insertItem(7, self.spacer_widget)
-            self.list_widget.setItemWidget(self.spacer_widget, spacer_widget)
 
         self.online_database_toggle.clicked.connect(self.toggle_online_database)
 
@@ -152,33 +208,17 @@ class MainWindow(QMainWindow):
         self.stacked_widget = QStackedWidget()
         self.splitter.addWidget(self.stacked_widget)
 
-        self.HomePage = HomePage(self)
-        self.MapView = MapView()
-        self.ReIDPage = ReIDDatabase()
-        self.DatabasePage = DatabasePage(self.ReIDPage)
-        self.UploadPage = UploadPage(self.app.current_user, self.DatabasePage)
-        self.UserProfile = UserProfile(self.app.current_user)
-
-        self.UploadPage.images_saved_signal.connect(self.DatabasePage.refresh_tree)
-
-        self.UserProfile.signOutSignal.connect(self.handle_sign_out)
-
-        self.stacked_widget.addWidget(self.HomePage)
-        self.stacked_widget.addWidget(self.UploadPage)
-        self.stacked_widget.addWidget(self.MapView)
-        self.stacked_widget.addWidget(self.DatabasePage)
-        self.stacked_widget.addWidget(self.ReIDPage)
-        self.stacked_widget.addWidget(self.UserProfile)
-
-        self.page_map = {
-            "Home": self.HomePage,
-            "Upload": self.UploadPage,
-            "Map": self.MapView,
-            "Local Database": self.DatabasePage,
-            "Online Database": None,
-            "ReID Database": self.ReIDPage,
-            "User": self.UserProfile
+        # Pages other than Home are only built the first time they are needed; page_map holds the built ones.
+        self.page_factories = {
+            "Home": self.create_home_page,
+            "Upload": self.create_upload_page,
+            "Map": self.create_map_view,
+            "Local Database": self.create_database_page,
+            "ReID Database": self.create_reid_page,
+            "User": self.create_user_profile
         }
+        self.page_map = {"Online Database": None}
+        self.get_page("Home")
 
         self.list_widget.currentItemChanged.connect(self.switch_page)
 
@@ -188,11 +228,59 @@ class MainWindow(QMainWindow):
         self.network_manager.connectivityChanged.connect(self.update_connectivity_status)
         self.network_manager.start()
 
+    def get_page(self, label):
+        """
+        Returns the page for a sidebar tab, building it and adding it to the stacked widget on first use.
+
+        Args:
+            label (str): The text of the sidebar tab.
+
+        Returns:
+            QWidget or None: The page, or None if the tab has no page available.
+        """
+        page = self.page_map.get(label)
+        if page is None and label in self.page_factories:
+            page = self.page_factories[label]()
+            self.page_map[label] = page
+            self.stacked_widget.addWidget(page)
+        return page
+
+    def create_home_page(self):
+        """Builds the home page."""
+        self.HomePage = HomePage(self)
+        return self.HomePage
+
+    def create_upload_page(self):
+        """Builds the upload page, which refreshes the local database page after saving images."""
+        database_page = self.get_page("Local Database")
+        self.UploadPage = UploadPage(self.app.current_user, database_page)
+        self.UploadPage.images_saved_signal.connect(database_page.refresh_tree)
+        return self.UploadPage
+
+    def create_map_view(self):
+        """Builds the map page."""
+        self.MapView = MapView()
+        return self.MapView
+
+    def create_database_page(self):
+        """Builds the local database page, which shares the ReID page."""
+        self.DatabasePage = DatabasePage(self.get_page("ReID Database"))
+        return self.DatabasePage
+
+    def create_reid_page(self):
+        """Builds the ReID database page."""
+        self.ReIDPage = ReIDDatabase()
+        return self.ReIDPage
+
+    def create_user_profile(self):
+        """Builds the user profile page."""
+        self.UserProfile = UserProfile(self.app.current_user)
+        self.UserProfile.signOutSignal.connect(self.handle_sign_out)
+        return self.UserProfile
+
     def load_stylesheet(self):
         """Load the stylesheet for the main window."""
-        css_file = os.path.join(os.path.dirname(__file__), 'css', 'main_window.css')
-        with open(css_file, 'r') as f:
-            self.setStyleSheet(f.read())
+        self.setStyleSheet(load_main_window_css())
 
     def hide_tabs(self, labels, status):
         """Hide or show tabs in the list widget based on the label.
@@ -201,9 +289,9 @@ class MainWindow(QMainWindow):
             labels: List of tab labels to hide or show.
             status: Boolean value to set visibility.
         """
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if item.text() in labels:
+        for label in labels:
+            item = self.tabs_by_label.get(label)
+            if item is not None:
                 item.setHidden(status)
 
     def update_connectivity_status(self, is_online):
@@ -219,7 +307,7 @@ class MainWindow(QMainWindow):
             if self.online_database_toggle.isChecked():
                 self.hide_tabs(["Online Database"], False)
                 if not hasattr(self, 'OnlineDatabasePage'):
-                    self.OnlineDatabasePage = OnlineDatabasePage(self.app.current_user, self.DatabasePage)
+                    self.OnlineDatabasePage = OnlineDatabasePage(self.app.current_user, self.get_page("Local Database"))
                     self.stacked_widget.insertWidget(4, self.OnlineDatabasePage)
                     self.page_map["Online Database"] = self.OnlineDatabasePage
         else:
@@ -235,44 +323,31 @@ class MainWindow(QMainWindow):
         Args:
             state (bool): Indicates the desired state of the Online Database toggle.
         """
-        settings = QSettings("YourCompany", "YourApp")
-        settings.setValue("online_database_enabled", state == self.online_database_toggle.isChecked())
+        checked = self.online_database_toggle.isChecked()
+        self.settings.setValue("online_database_enabled", checked)
 
-        if self.online_database_toggle.isChecked():
+        if checked:
             self.online_database_toggle.setText("Online Database: On")
-            settings = QSettings("YourCompany", "YourApp")
-            settings.setValue("online_database_enabled", True)
             QMessageBox.information(self, "Online Database", "Online Database enabled.")
-            if self.network_manager.is_online():
+            if self.network_manager.last_known_status():
                 self.sync_users()
                 if not hasattr(self, 'OnlineDatabasePage'):
-                    self.OnlineDatabasePage = OnlineDatabasePage(self.app.current_user, self.DatabasePage)
+                    self.OnlineDatabasePage = OnlineDatabasePage(self.app.current_user, self.get_page("Local Database"))
                     self.stacked_widget.insertWidget(4, self.OnlineDatabasePage)
                     self.page_map["Online Database"] = self.OnlineDatabasePage
 
-                if self.spacer_widget is not None:
-                    self.list_widget.takeItem(self.list_widget.row(self.spacer_widget))
-                    self.spacer_widget = None
+                self.spacer_widget.setHidden(True)
         else:
             self.online_database_toggle.setText("Online Database: Off")
             QMessageBox.information(self, "Online Database", "Online Database disabled.")
-            settings = QSettings("YourCompany", "YourApp")
-            settings.setValue("online_database_enabled", False)
             self.hide_tabs(["Online Database"], True)
-            if self.network_manager.is_online():
+            if self.network_manager.last_known_status():
                 self.sync_online_users()
             if hasattr(self, 'OnlineDatabasePage'):
                 self.stacked_widget.removeWidget(self.OnlineDatabasePage)
                 del self.OnlineDatabasePage
-
-            if self.spacer_widget is None:
-                self.spacer_widget = QListWidgetItem()
-                spacer_widget = QWidget()
-                spacer_layout = QVBoxLayout(spacer_widget)
-                spacer_layout.addStretch()
-                self.spacer_widget.setSizeHint(QSize(100, 40))
-                self.list_widget.insertItem(7, self.spacer_widget)
-                self.list_widget.setItemWidget(self.spacer_widget, spacer_widget)
+                self.page_map["Online Database"] = None
+            self.spacer_widget.setHidden(False)
 
     def load_online_database_setting(self):
         """
@@ -282,16 +357,14 @@ class MainWindow(QMainWindow):
         Returns:
             bool: True if the Online Database is enabled, False otherwise.
         """
-        settings = QSettings("YourCompany", "YourApp")
-        return settings.value("online_database_enabled", False, type=bool)
+        return self.settings.value("online_database_enabled", False, type=bool)
 
     def handle_sign_out(self):
         """
         Handles the sign-out process for the user, updating the application settings
         to reflect that the user is no longer logged in.
         """
-        settings = QSettings("YourCompany", "YourApp")
-        settings.setValue("loggedIn", False)
+        self.settings.setValue("loggedIn", False)
         self.app.handle_sign_out()
 
     def check_unsynced_photos(self):
@@ -310,16 +383,25 @@ class MainWindow(QMainWindow):
     def check_last_synced_status(self):
         """
         Checks the last synced status for the current user. If online, retrieves the
-        last synced time and updates the label accordingly.
+        last synced time on a worker thread and updates the label once it arrives.
+        """
+        if self.network_manager.last_known_status():
+            current_user = self.app.current_user
+            task = DatabaseTask(lambda: get_online_database().get_status(current_user))
+            task.signals.finished.connect(self.show_last_synced_status)
+            QThreadPool.globalInstance().start(task)
+
+    def show_last_synced_status(self, last_synced):
         """
-        connection = NetworkManager()
-        if connection.is_online():
-            conn = OnlineDatabase()
-            last_synced = conn.get_status(self.app.current_user)
-            if last_synced:
-                self.last_synced_label.setText(f"Last Synced: {last_synced}")
-            else:
-                self.last_synced_label.setText("Has not been Synced")
+        Shows the last synced time retrieved by check_last_synced_status.
+
+        Args:
+            last_synced: The last synced time of the current user, or None if they have never synced.
+        """
+        if last_synced:
+            self.last_synced_label.setText(f"Last Synced: {last_synced}")
+        else:
+            self.last_synced_label.setText("Has not been Synced")
 
     def switch_page(self, current_item, previous_item):
         """
@@ -333,7 +415,7 @@ class MainWindow(QMainWindow):
         if current_item is None:
             return
 
-        page = self.page_map.get(current_item.text())
+        page = self.get_page(current_item.text())
 
         if page is not None:
             self.stacked_widget.setCurrentWidget(page)
@@ -341,21 +423,17 @@ class MainWindow(QMainWindow):
 
     def sync_users(self):
         """
-        Syncs all user accounts with the online database if the connection is active.
+        Syncs all user accounts with the online database on a worker thread if the connection is active.
         """
-        connection = NetworkManager()
-        if connection.is_online():
-            conn = OnlineDatabase()
-            conn.sync_all_user_accounts()
+        if self.network_manager.last_known_status():
+            QThreadPool.globalInstance().start(DatabaseTask(lambda: get_online_database().sync_all_user_accounts()))
 
     def sync_online_users(self):
         """
-        Syncs users from the online database to the local database if the connection is
-        active.
+        Syncs users from the online database to the local database on a worker thread if the
+        connection is active.
         """
-        local_user_db = UserDatabaseHelper()
-        connection = NetworkManager()
-        if connection.is_online():
-            conn = OnlineDatabase()
-            all_online_users = conn.get_all_users()
-            local_user_db.sync_user(all_online_users)
+        if self.network_manager.last_known_status():
+            local_user_db = self.local_user_db
+            QThreadPool.globalInstance().start(
+                DatabaseTask(lambda: local_user_db.sync_user(get_online_database().get_all_users())))
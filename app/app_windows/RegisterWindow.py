@@ -2,18 +2,85 @@ import hashlib
 import smtplib
 import os
 from email.mime.text import MIMEText
+from functools import lru_cache
 
-from PyQt5.QtCore import QTimer, Qt, QSettings
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import Qt, QSettings, QThreadPool, QObject, QRunnable, pyqtSignal
+from PyQt5.QtNetwork import QNetworkConfigurationManager
 from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QLineEdit, QPushButton, QMessageBox
 from app.util.user_database_helper import UserDatabaseHelper
 from app.databases import model
-from app.databases.conn import OnlineDatabase
-from app.util.network_manager import NetworkManager
+from app.databases.conn import get_online_database
+from app.util.network_manager import NetworkManager, NetworkProbe
+from app.util.resource_cache import load_scaled_pixmap
 
 connection = NetworkManager()
 local_user_db = UserDatabaseHelper()
 
+
+@lru_cache(maxsize=1)
+def load_register_css():
+    """
+    Reads the registration window stylesheet, which is only read from disk once per run.
+
+    Returns:
+        str: The contents of register_window.css.
+    """
+    css_file = os.path.join(os.path.dirname(__file__), 'css', 'register_window.css')
+    with open(css_file, 'r') as f:
+        return f.read()
+
+
+class RegisterTaskSignals(QObject):
+    """
+    Signals emitted by a RegisterTask, which cannot emit signals itself as a QRunnable.
+
+    Signals:
+        finished (str): Emitted with the outcome: 'registered', 'exists', 'offline' or 'error'.
+    """
+    finished = pyqtSignal(str)
+
+
+class RegisterTask(QRunnable):
+    """
+    Checks that an email is free, hashes the password and adds the user on a worker thread.
+
+    Args:
+        user_db: The local or online user database to register the user in.
+        email (str): The email of the new user.
+        username (str): The username of the new user.
+        password (str): The password of the new user.
+        check_online (bool): Whether to check for an internet connection before registering the user.
+    """
+    def __init__(self, user_db, email, username, password, check_online=False):
+        super().__init__()
+        self.user_db = user_db
+        self.email = email
+        self.username = username
+        self.password = password
+        self.check_online = check_online
+        self.signals = RegisterTaskSignals()
+
+    def run(self):
+        """
+        Register the user and emit the outcome.
+        """
+        try:
+            if self.check_online and not connection.is_online():
+                self.signals.finished.emit('offline')
+                return
+            if self.user_db.check_username(self.email):
+                outcome = 'exists'
+            else:
+                new_user = model.User(email=self.email, username=self.username)
+                new_user.set_password(self.password)
+                self.user_db.add_user(new_user)
+                outcome = 'registered'
+        except Exception as e:
+            print(f"Error registering {self.email}: {e}")
+            outcome = 'error'
+        self.signals.finished.emit(outcome)
+
+
 class RegisterWindow(QDialog):
     """
     A dialog window for user registration. This window allows users to
@@ -29,7 +96,7 @@ class RegisterWindow(QDialog):
         confirm_password_input (QLineEdit): Input field for confirming the password.
         confirm_button (QPushButton): Button to confirm registration.
         wifi_label (QLabel): Displays the Wi-Fi connection status icon.
-        timer (QTimer): Timer to periodically check the connectivity status.
+        network_config_manager (QNetworkConfigurationManager): Reports network changes that trigger a connectivity check.
         settings (QSettings): Application settings to store and retrieve user preferences.
         is_online_database (bool): Flag indicating if the online database is enabled.
     """
@@ -57,8 +124,8 @@ class RegisterWindow(QDialog):
 
         self.logo_label = QLabel(self)
         self.logo_label.setObjectName("image")
-        self.logo_pixmap = QPixmap('app/resources/icons/logo.png')
-        self.logo_label.setPixmap(self.logo_pixmap.scaled(200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        self.logo_pixmap = load_scaled_pixmap('app/resources/icons/logo.png', 200)
+        self.logo_label.setPixmap(self.logo_pixmap)
         self.layout.addWidget(self.logo_label, alignment=Qt.AlignCenter)
 
         self.layout.addSpacing(20)
@@ -101,15 +168,17 @@ class RegisterWindow(QDialog):
         # Wifi Icon
         self.wifi_label = QLabel(self)
         self.wifi_label.setFixedSize(30, 30)
+        self.online_pixmap = load_scaled_pixmap('app/resources/icons/online-icon.png', 30)
+        self.offline_pixmap = load_scaled_pixmap('app/resources/icons/offline-icon.png', 30)
+        self.set_wifi_icon(connection.last_known_status())
         self.update_wifi_icon()
         self.layout.addWidget(self.wifi_label, alignment=Qt.AlignCenter)
 
         self.layout.addSpacing(50)
 
-        # Timer that checks connectivity every 10 seconds
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_wifi_icon)
-        self.timer.start(10000)
+        # Re-probe connectivity only when the system reports a network change
+        self.network_config_manager = QNetworkConfigurationManager(self)
+        self.network_config_manager.onlineStateChanged.connect(lambda online: self.update_wifi_icon())
 
         self.confirm_button.clicked.connect(self.handle_register)
         self.settings = QSettings("YourCompany", "YourApp")
@@ -119,59 +188,56 @@ class RegisterWindow(QDialog):
         """
         Loads the stylesheet for the registration window from a CSS file.
         """
-        css_file = os.path.join(os.path.dirname(__file__), 'css', 'register_window.css')
-        with open(css_file, 'r') as f:
-            self.setStyleSheet(f.read())
+        self.setStyleSheet(load_register_css())
 
     def handle_register(self):
         """
         Handles the registration process when the register button is clicked.
-        Validates user input, checks for existing usernames, and adds a new user
-        to the appropriate database (local or online).
+        Validates user input, then checks for existing usernames and adds the new user
+        to the appropriate database (local or online) as a RegisterTask on the global
+        thread pool.
         """
         email = self.email_input.text()
         username = self.username_input.text()
         password = self.password_input.text()
         confirm_password = self.confirm_password_input.text()
         if not self.is_online_database:
-            if username.strip() == "" or password == "" or confirm_password == "" or email.strip() == "":
-                QMessageBox.warning(self, "Invalid Input", "Please Enter all fields")
-
-            elif local_user_db.check_username(email):
-                QMessageBox.warning(self, "Email already registered", "Email already registered")
-
-            elif password != confirm_password:
-                QMessageBox.warning(self, "Passwords", "Passwords do not match")
-
-            else:
-                new_user = model.User(email=email, username=username)
-                new_user.set_password(password)
-                local_user_db.add_user(new_user)
-                QMessageBox.information(self, "Success", "Registration successful!")
-                self.accept()
+            user_db = local_user_db
         else:
-            if not connection.is_online():
-                QMessageBox.warning(self, 'No Internet',
-                    'You are not connected to the internet. Please connect and try again.')
-            else:
-                conn = OnlineDatabase()
-
-                if username.strip() == "" or password == "" or confirm_password == "" or email.strip() == "":
-                    QMessageBox.warning(self, "Invalid Input", "Please Enter all fields")
-
-                elif conn.check_username(email):
-                    QMessageBox.warning(self, "Email already registered", "Email already registered")
+            user_db = get_online_database()
 
-                elif password != confirm_password:
-                    QMessageBox.warning(self, "Passwords", "Passwords do not match")
-
-                else:
-                    new_user = model.User(email=email, username = username)
-                    new_user.set_password(password)
-                    conn.add_user(new_user)
-                    QMessageBox.information(self, "Success", "Registration successful!")
-                    self.accept()
+        if username.strip() == "" or password == "" or confirm_password == "" or email.strip() == "":
+            QMessageBox.warning(self, "Invalid Input", "Please Enter all fields")
+        elif password != confirm_password:
+            QMessageBox.warning(self, "Passwords", "Passwords do not match")
+        else:
+            self.confirm_button.setEnabled(False)
+            self.confirm_button.setText("Registering...")
+            # The connectivity check can block on the network, so it runs with the rest of the registration.
+            register_task = RegisterTask(user_db, email, username, password,
+                                         check_online=bool(self.is_online_database))
+            register_task.signals.finished.connect(self.registration_finished)
+            QThreadPool.globalInstance().start(register_task)
+
+    def registration_finished(self, outcome):
+        """
+        Reports the result of a background registration and accepts the dialog on success.
 
+        Args:
+            outcome (str): The outcome emitted by RegisterTask.
+        """
+        self.confirm_button.setEnabled(True)
+        self.confirm_button.setText("Register")
+        if outcome == 'registered':
+            QMessageBox.information(self, "Success", "Registration successful!")
+            self.accept()
+        elif outcome == 'exists':
+            QMessageBox.warning(self, "Email already registered", "Email already registered")
+        elif outcome == 'offline':
+            QMessageBox.warning(self, 'No Internet',
+                'You are not connected to the internet. Please connect and try again.')
+        else:
+            QMessageBox.warning(self, "Error", "Registration failed. Please try again.")
 
     def send_confirmation_email(self, email):
         """
@@ -198,11 +264,18 @@ class RegisterWindow(QDialog):
     def update_wifi_icon(self):
         """
         Updates the Wi-Fi icon based on the current network connectivity status.
-        If the application is online, it displays the online icon; otherwise,
-        it displays the offline icon.
+        The status is probed on the global thread pool and shown by set_wifi_icon
+        once the probe reports back.
         """
-        if connection.is_online():
-            wifi_icon = QPixmap('app/resources/icons/online-icon.png')
-        else:
-            wifi_icon = QPixmap('app/resources/icons/offline-icon.png')
-        self.wifi_label.setPixmap(wifi_icon.scaled(30, 30, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        probe = NetworkProbe()
+        probe.signals.finished.connect(self.set_wifi_icon)
+        QThreadPool.globalInstance().start(probe)
+
+    def set_wifi_icon(self, online):
+        """
+        Shows the online or offline Wi-Fi icon.
+
+        Args:
+            online (bool): Whether the application is connected to the internet.
+        """
+        self.wifi_label.setPixmap(self.online_pixmap if online else self.offline_pixmap)
@@ -1,5 +1,6 @@
 import multiprocessing
 import os
+from functools import lru_cache
 
 import pytz
 from PyQt5.QtGui import QPixmap, QImage
@@ -59,6 +60,8 @@ class OnlineDatabase:
         self.Session = sessionmaker(bind=self.engine)
         self.connectivity = NetworkManager()
         self.local_user_db = UserDatabaseHelper()
+        # Usernames already looked up by get_username_by_id, keyed by user id.
+        self.usernames = {}
 
     def connect(self):
         """Establish a connection to the online database.
@@ -90,9 +93,6 @@ class OnlineDatabase:
                 session.add(user)
                 session.commit()  # Commit the transaction here
                 print("User added successfully.")
-                users = session.query(model.User).all()
-                for user in users:
-                    print(f'{type(user)} - {user.email}')
             else:
                 print("User already exists.")
         except Exception as ex:
@@ -190,6 +190,24 @@ class OnlineDatabase:
             session.close()
             return user
 
+    def get_username_by_id(self, user_id):
+        """Retrieve the username of a user by their ID.
+
+        Usernames that were found are cached, as a user's id and username do not change while the app is running.
+
+        Args:
+            user_id (int): The ID of the user.
+
+        Returns:
+            str or None: The username if the user was found, else None.
+        """
+        if user_id not in self.usernames:
+            user = self.get_user_by_id(user_id)
+            if user is None:
+                return None
+            self.usernames[user_id] = user.username
+        return self.usernames[user_id]
+
     def get_folder_names(self):
         """Retrieve distinct folder names from photos based on their creation date.
 
@@ -230,6 +248,31 @@ class OnlineDatabase:
             session.close()
             return images
 
+    def get_images_by_folders(self, folder_names):
+        """Retrieve the images of several folders with a single query.
+
+        Args:
+            folder_names (iterable): The folder names to fetch images for.
+
+        Returns:
+            dict: A dictionary mapping each folder name to a list of its image thumbnails.
+        """
+        folder_names = list(folder_names)
+        images_by_folder = {folder: [] for folder in folder_names}
+        if not folder_names:
+            return images_by_folder
+        with self.Session() as session:
+            # Truncate the last 16 characters from group_name and compare with the folder names
+            truncated_group_name = func.substr(model.Photo.group_name, 1, func.length(model.Photo.group_name) - 16)
+
+            rows = session.query(model.Photo.group_name, model.Photo.thumbnail).filter(
+                truncated_group_name.in_(folder_names)
+            ).all()
+
+            for group_name, thumbnail in rows:
+                images_by_folder[group_name[:-16]].append((thumbnail,))
+            return images_by_folder
+
     def update_status(self, user_id):
         """Update the last synced time for a user.
 
@@ -278,6 +321,27 @@ class OnlineDatabase:
         model.Base.metadata.create_all(self.engine)
         print("Tables created successfully.")
 
+    def add_photo_key_columns(self):
+        """Add the S3 key columns to the photos table and fill them in for existing rows.
+
+        This is a schema migration against the shared database and is run once by an administrator through
+        app/databases/migrate_photo_keys.py, never by the application itself. Safe to run repeatedly: columns
+        are only added if missing and only rows without keys are updated. URLs that do not contain the
+        expected path are left with a NULL key so the application falls back to the URL.
+        """
+        with self.engine.begin() as db:
+            for column in ("bbox_key", "cropped_key", "thumbnail_key"):
+                db.execute(text(f"ALTER TABLE photos ADD COLUMN IF NOT EXISTS {column} VARCHAR"))
+            db.execute(text("""
+                UPDATE photos SET
+                    bbox_key = REPLACE('images' || NULLIF(split_part(bbox, 'temporary_detected_images', 2), ''),
+                                       'bbox_images', 'bbox'),
+                    cropped_key = REPLACE('images' || NULLIF(split_part(cropped, 'temporary_detected_images', 2), ''),
+                                          'crop_images', 'cropped'),
+                    thumbnail_key = 'images' || NULLIF(split_part(thumbnail, 'temporary_detected_images', 2), '')
+                WHERE bbox_key IS NULL AND cropped_key IS NULL AND thumbnail_key IS NULL
+            """))
+
     def check_admin_status(self, username):
         """Check if a user is an admin.
 
@@ -305,6 +369,44 @@ class OnlineDatabase:
             session.close()
             return all_users
 
+    def load_users(self, authorised=None, limit=None, before_id=None):
+        """Load the non-admin users, newest first, filtered by authorisation status in the query.
+
+        Args:
+            authorised (bool, optional): If given, only users whose authorised status matches are returned.
+            limit (int, optional): The maximum number of users to return.
+            before_id (int, optional): If given, only users with a lower id are returned, so the next page
+                continues from the last user of the previous one.
+
+        Returns:
+            list: A list of matching user objects.
+        """
+        with self.Session() as session:
+            query = session.query(model.User).filter(model.User.is_admin.is_(False))
+            if authorised is not None:
+                query = query.filter(model.User.is_authorised.is_(authorised))
+            if before_id is not None:
+                query = query.filter(model.User.id < before_id)
+            query = query.order_by(model.User.id.desc())
+            if limit is not None:
+                query = query.limit(limit)
+            users = query.all()
+            session.close()
+            return users
+
+    def set_users_authorised(self, usernames, authorised):
+        """Set the authorised status of several users in a single transaction.
+
+        Args:
+            usernames (list): The emails of the users to update.
+            authorised (bool): The authorised status to set.
+        """
+        with self.Session() as session:
+            session.query(model.User).filter(model.User.email.in_(usernames)).update(
+                {model.User.is_authorised: authorised}, synchronize_session=False)
+            session.commit()
+            session.close()
+
     def approve_user(self, username):
         """Approve a user by setting their authorized status to True.
 
@@ -417,3 +519,16 @@ class OnlineDatabase:
         session.close()
         return filtered_animals
 
+
+
+@lru_cache(maxsize=None)
+def get_online_database():
+    """Return the process-wide OnlineDatabase.
+
+    Sharing one instance shares its engine's connection pool, so callers reuse an open
+    connection instead of opening a new one to the server each time.
+
+    Returns:
+        OnlineDatabase: The shared online database.
+    """
+    return OnlineDatabase()
@@ -0,0 +1,17 @@
+"""One-off migration that adds the S3 key columns to the online photos table.
+
+Run it once from the project root, before deploying a version of the application whose Photo model maps
+bbox_key, cropped_key and thumbnail_key:
+
+    python -m app.databases.migrate_photo_keys
+"""
+from app.databases.conn import get_online_database
+
+
+if __name__ == "__main__":
+    try:
+        get_online_database().add_photo_key_columns()
+        print("Added and backfilled the S3 key columns on photos.")
+    except Exception as e:
+        print(f"Error adding S3 key columns to photos: {e}")
+        raise SystemExit(1)
@@ -76,7 +76,8 @@ class Photo(Base):
     Attributes:
         user_id (int): Foreign key referencing the user who owns the photo.
         image_data (str): Raw image data or path to the image.
-        description (str): Description of the photo (optional).
+        description (str): Deprecated and no longer written; the URLs it held live in the
+            thumbnail and cropped columns.
         is_synced (bool): Indicates if the photo has been synchronized (default is False).
         created_at (datetime): Timestamp of photo creation.
         confidence (float): Confidence score for image classification (optional).
@@ -85,6 +86,9 @@ class Photo(Base):
         thumbnail (str): Path to the thumbnail image (optional).
         bbox (str): Bounding box coordinates for the image (optional).
         cropped (str): Path to the cropped version of the image (optional).
+        bbox_key (str): S3 key of the bounding box image (optional).
+        cropped_key (str): S3 key of the cropped image (optional).
+        thumbnail_key (str): S3 key of the thumbnail image (optional).
         name (str): Unique identifier for the photo (primary key).
         animal (str): Type of animal depicted in the photo (optional).
 
@@ -102,6 +106,9 @@ class Photo(Base):
     thumbnail = Column(String, nullable=True)
     bbox = Column(String, nullable=True)
     cropped = Column(String, nullable=True)
+    bbox_key = Column(String, nullable=True)
+    cropped_key = Column(String, nullable=True)
+    thumbnail_key = Column(String, nullable=True)
     name = Column(String, primary_key=True, nullable=False)
     animal = Column(String, nullable=True)
 
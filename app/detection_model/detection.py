@@ -1,8 +1,13 @@
 import os
+import threading
 import cv2
 import numpy as np
 from ultralytics import YOLO
 
+# The YOLO model is loaded once per process and shared by every detection call.
+_model = None
+_model_lock = threading.Lock()
+
 def draw_bounding_box(image, bbox, confidence):
     x1, y1, x2, y2 = list(map(round, bbox))
     cv2.rectangle(image, (x1, y1), (x2, y2), (0, 0, 255), 25)
@@ -23,8 +28,7 @@ def crop_image(image, bbox):
     x1, y1, x2, y2 = list(map(round, bbox))
     return image[y1:y2, x1:x2, :]
 
-def make_inference_detection(yolo, image):
-    prediction = yolo(image)[0]
+def extract_detection(prediction, image):
     class_dict = prediction.names
     array_of_confidences = prediction.boxes.conf.numpy()
     array_of_labels = prediction.boxes.cls.numpy()
@@ -41,20 +45,41 @@ def make_inference_detection(yolo, image):
 
     return image_with_box, image_with_crop, label, max_conf
 
-def main(images):
-    DEVICE = "cpu"
+def get_model():
+    """Returns the shared detection model, loading it on first use."""
+    global _model
+    with _model_lock:
+        if _model is None:
+            DEVICE = "cpu"
 
-    model_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'detection_model', 'best_50.pt'))
-    
-    if not os.path.exists(model_path):
-        raise FileNotFoundError(f"The model file '{model_path}' does not exist.")
+            model_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'detection_model', 'best_50.pt'))
+
+            if not os.path.exists(model_path):
+                raise FileNotFoundError(f"The model file '{model_path}' does not exist.")
+
+            _model = YOLO(model_path).to(DEVICE)
+        return _model
+
+def detect_images(images):
+    """Runs detection on a batch of images with the shared model.
+
+    Returns one (bbox_image, cropped_image, label, confidence) tuple per input image,
+    or None for an image in which nothing was detected, so results line up with the input.
+    """
+    if not images:
+        return []
+
+    yolo = get_model()
+    detections = []
 
-    yolo = YOLO(model_path).to(DEVICE)
-    image_with_boxes = []
+    # A list input is letterboxed and stacked into one tensor by the model, giving a single forward pass.
+    predictions = yolo(list(images))
 
-    for image in images:
-        bbox_image, cropped_image, label, confidence = make_inference_detection(yolo, image)
+    for prediction, image in zip(predictions, images):
+        bbox_image, cropped_image, label, confidence = extract_detection(prediction, image)
         if bbox_image is not None:
-            image_with_boxes.append((bbox_image, cropped_image, label, confidence))
+            detections.append((bbox_image, cropped_image, label, confidence))
+        else:
+            detections.append(None)
 
-    return image_with_boxes
+    return detections
@@ -1,8 +1,13 @@
 import sqlite3
 import os
+from collections import namedtuple
 from datetime import datetime
 from app.databases.model import User
 
+# A row of the images table, with fields named in column order.
+ImageRow = namedtuple("ImageRow", "id user bbox_image_path cropped_image_path thumbnail_path location "
+                                  "upload_date confidence group_name is_synced animal")
+
 class DatabaseHelper:
     def __init__(self):
         """Initializes the DatabaseHelper and creates necessary tables."""
@@ -33,6 +38,10 @@ class DatabaseHelper:
                     animal TEXT
                 )
             """)
+            # Sync lookups filter on is_synced, so index it rather than scanning the whole table.
+            self.connection.execute("""
+                CREATE INDEX IF NOT EXISTS idx_images_is_synced ON images(is_synced)
+            """)
 
     def create_reid_table(self):
         """Creates the reid table if it doesn't already exist."""
@@ -47,6 +56,9 @@ class DatabaseHelper:
                     FOREIGN KEY (image_id) REFERENCES images(id) ON DELETE CASCADE
                 )
             """)
+            self.connection.execute("""
+                CREATE INDEX IF NOT EXISTS idx_reid_run_datetime ON reid(run_datetime)
+            """)
 
     def create_user_table(self):
         """Creates the users table if it doesn't already exist."""
@@ -124,6 +136,21 @@ class DatabaseHelper:
             """, (
             user, bbox_image_path, cropped_image_path, thumbnail_path, location, upload_date, confidence, group_name, animal))
 
+    def insert_images_bulk(self, rows):
+        """Inserts several image records into the images table in a single transaction.
+
+        Args:
+            rows (list): Tuples of (user, bbox_image_path, cropped_image_path, thumbnail_path, location,
+                upload_date, confidence, group_name, animal), in the same order as insert_image takes them.
+        """
+        rows = [row[:6] + (float(row[6]),) + row[7:] for row in rows]
+
+        with self.connection:
+            self.connection.executemany("""
+                INSERT INTO images (user, bbox_image_path, cropped_image_path, thumbnail_path, location, upload_date, confidence, group_name, animal)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+
     def fetch_unsynced_images(self):
         """Fetches all unsynced images from the images table.
 
@@ -167,6 +194,25 @@ class DatabaseHelper:
                 WHERE id = ?""", (image_id,))
             return result.fetchone()
 
+    def fetch_image_paths_by_reids(self, reid_ids):
+        """Fetches the image paths of several re-identification results in a single query.
+
+        Args:
+            reid_ids (list): A list of re-identification result IDs.
+
+        Returns:
+            list: A list of (bbox_image_path, cropped_image_path, thumbnail_path) tuples.
+        """
+        if not reid_ids:
+            return []
+        with self.connection:
+            return self.connection.execute(f"""
+                SELECT images.bbox_image_path, images.cropped_image_path, images.thumbnail_path
+                FROM reid
+                JOIN images ON images.id = reid.image_id
+                WHERE reid.id IN ({','.join('?' for _ in reid_ids)})
+            """, list(reid_ids)).fetchall()
+
     def get_connection(self):
         """Gets a new database connection.
 
@@ -220,6 +266,19 @@ class DatabaseHelper:
                 DELETE FROM images WHERE id = ?
             """, (image_id,))
 
+    def delete_images_bulk(self, image_ids):
+        """Deletes several images from the images table in a single transaction.
+
+        Args:
+            image_ids (list): A list of image IDs to be deleted.
+        """
+        if not image_ids:
+            return
+        with self.connection:
+            self.connection.execute(f"""
+                DELETE FROM images WHERE id IN ({','.join('?' for _ in image_ids)})
+            """, list(image_ids))
+
     def delete_reid(self, image_id):
         """Deletes a re-identification result from the reid table based on the image ID.
 
@@ -231,6 +290,19 @@ class DatabaseHelper:
                 DELETE FROM reid WHERE id = ?
             """, (image_id,))
 
+    def delete_reid_bulk(self, reid_ids):
+        """Deletes several re-identification results from the reid table in a single statement.
+
+        Args:
+            reid_ids (list): A list of re-identification result IDs.
+        """
+        if not reid_ids:
+            return
+        with self.connection:
+            self.connection.execute(f"""
+                DELETE FROM reid WHERE id IN ({','.join('?' for _ in reid_ids)})
+            """, list(reid_ids))
+
 
     def close(self):
         """Closes the database connection."""
@@ -265,6 +337,23 @@ class DatabaseHelper:
                 WHERE id = ?
             """, (image_id,))
 
+    def mark_images_as_synced(self, image_ids):
+        """Marks several images as synced in the images table in a single transaction.
+
+        Args:
+            image_ids (list): A list of IDs of the images to be marked as synced.
+        """
+        image_ids = list(image_ids)
+        with self.connection:
+            # Stay below SQLite's limit on the number of bound parameters per statement.
+            for start in range(0, len(image_ids), 500):
+                chunk = image_ids[start:start + 500]
+                self.connection.execute(f"""
+                    UPDATE images
+                    SET is_synced = 1
+                    WHERE id IN ({','.join('?' for _ in chunk)})
+                """, chunk)
+
     def fetch_unsynced_image_count(self):
         """Fetches the count of unsynced images.
 
@@ -278,12 +367,16 @@ class DatabaseHelper:
             return result[0] if result else 0
 
     def images_tosync(self):
-        """Fetches the unsynced images. """
+        """Fetches the unsynced images.
+
+        Returns:
+            list: A list of ImageRow records for every unsynced image.
+        """
         with self.connection:
             result = self.connection.execute("""
                 SELECT * FROM images WHERE is_synced = 0
             """).fetchall()
-            return result
+            return [ImageRow(*row) for row in result]
 
     def get_images_by_date(self):
         """Gets images by upload date and returns a dict of image records."""
@@ -314,6 +407,36 @@ class DatabaseHelper:
                     reid_dict[x[0]].append(x[1])
             return reid_dict
 
+    def get_reid_dates(self):
+        """Gets the distinct re-identification run dates in the order they were first recorded.
+
+        Returns:
+            list: A list of run date strings.
+        """
+        with self.connection:
+            result = self.connection.execute("""
+            SELECT run_datetime FROM reid
+            GROUP BY run_datetime
+            ORDER BY MIN(id)""").fetchall()
+        return [row[0] for row in result]
+
+    def get_reid_ids_for_date(self, date):
+        """Gets the distinct re-identification IDs of a single run date.
+
+        Args:
+            date (str): The date of the re-identification run.
+
+        Returns:
+            list: A list of re-identification IDs in the order they were first recorded.
+        """
+        with self.connection:
+            result = self.connection.execute("""
+            SELECT reid_id FROM reid
+            WHERE run_datetime = ?
+            GROUP BY reid_id
+            ORDER BY MIN(id)""", (date,)).fetchall()
+        return [row[0] for row in result]
+
     def get_image_by_date_and_id(self, date, id):
         """Fetches images based on the specified date and re-identification ID.
 
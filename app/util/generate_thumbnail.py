@@ -3,7 +3,10 @@ import cv2
 
 def generate_thumbnail(image_path, thumbnail_dir, thumbnail_size=(150, 150)):
     """Generates a thumbnail for each image, taking up less memory and space"""
-    image = cv2.imread(image_path)
+    # Let the JPEG decoder downscale by 4 while decoding, falling back to a full decode for small images.
+    image = cv2.imread(image_path, cv2.IMREAD_REDUCED_COLOR_4)
+    if image is None or image.shape[1] < thumbnail_size[0] or image.shape[0] < thumbnail_size[1]:
+        image = cv2.imread(image_path)
     thumbnail = cv2.resize(image, thumbnail_size, interpolation=cv2.INTER_AREA)
 
     if not os.path.exists(thumbnail_dir):
@@ -12,6 +15,6 @@ def generate_thumbnail(image_path, thumbnail_dir, thumbnail_size=(150, 150)):
     filename = os.path.basename(image_path)
     thumbnail_path = os.path.join(thumbnail_dir, filename)
 
-    cv2.imwrite(thumbnail_path, thumbnail)
+    cv2.imwrite(thumbnail_path, thumbnail, [cv2.IMWRITE_JPEG_QUALITY, 80])
 
     return thumbnail_path
\ No newline at end of file
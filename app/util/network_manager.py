@@ -1,13 +1,29 @@
-from PyQt5.QtCore import QThread, pyqtSignal
+import time
+
+from PyQt5.QtCore import QThread, QObject, QRunnable, pyqtSignal
 import requests
 
+# How long a single connectivity probe waits for a response.
+PROBE_TIMEOUT_SECONDS = 5
+# How long the background thread sleeps between probes.
+PROBE_INTERVAL_MS = 1000
+# How long a connectivity probe result is reused before the network is checked again. This is longer
+# than a full probe cycle, so while the background thread is running the cached result never goes stale.
+STATUS_TTL_SECONDS = PROBE_TIMEOUT_SECONDS + PROBE_INTERVAL_MS / 1000 + 4
+
+
 class NetworkManager(QThread):
     """Thread to manage network connectivity checks.
 
     Inherits from QThread to run network status checks in a separate thread,
     emitting signals to notify when connectivity status changes.
+
+    The result of the last probe is shared by every instance and reused for
+    STATUS_TTL_SECONDS, so repeated is_online() calls do not each block on an
+    HTTP request.
     """
     connectivityChanged = pyqtSignal(bool)
+    cached_status = None
 
     def run(self):
         """Continuously checks for network connectivity.
@@ -17,21 +33,70 @@ class NetworkManager(QThread):
         every second.
         """
         while True:
-            online_status = self.is_online()
+            online_status = self.probe()
             self.connectivityChanged.emit(online_status)
-            self.msleep(1000)
+            self.msleep(PROBE_INTERVAL_MS)
 
     def is_online(self):
+        """Returns the internet connectivity status, probing only when the cached result is stale.
+
+        Returns:
+            bool: True if online, False otherwise.
+        """
+        cached = NetworkManager.cached_status
+        if cached is not None and time.monotonic() - cached[0] < STATUS_TTL_SECONDS:
+            return cached[1]
+        return self.probe()
+
+    def last_known_status(self):
+        """Returns the most recent probe result without touching the network.
+
+        Returns:
+            bool: True if the last probe succeeded, False if it failed or no probe has run yet.
+        """
+        cached = NetworkManager.cached_status
+        return cached[1] if cached is not None else False
+
+    @staticmethod
+    def probe():
         """Checks the internet connectivity status.
 
         Attempts to send a GET request to a reliable server (Google)
-        to determine if the internet connection is available.
+        to determine if the internet connection is available, and caches
+        the result for later is_online() calls.
 
         Returns:
             bool: True if online, False otherwise.
         """
         try:
-            requests.get("https://www.google.com", timeout=5)
-            return True
+            requests.get("https://www.google.com", timeout=PROBE_TIMEOUT_SECONDS)
+            online_status = True
         except requests.exceptions.RequestException:
-            return False
+            online_status = False
+        NetworkManager.cached_status = (time.monotonic(), online_status)
+        return online_status
+
+
+class NetworkProbeSignals(QObject):
+    """
+    Signals emitted by a NetworkProbe, which cannot emit signals itself as a QRunnable.
+
+    Signals:
+        finished (bool): Emitted with the connectivity status once the probe completes.
+    """
+    finished = pyqtSignal(bool)
+
+
+class NetworkProbe(QRunnable):
+    """
+    Checks connectivity on a worker thread so the GUI thread never waits on the network.
+    """
+    def __init__(self):
+        super().__init__()
+        self.signals = NetworkProbeSignals()
+
+    def run(self):
+        """
+        Probe the network and emit the result.
+        """
+        self.signals.finished.emit(NetworkManager.probe())
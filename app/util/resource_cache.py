@@ -0,0 +1,33 @@
+from functools import lru_cache
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QIcon, QPixmap
+
+
+@lru_cache(maxsize=None)
+def load_icon(path):
+    """Loads an icon, which is only read from disk once per run.
+
+    Args:
+        path (str): The path to the icon image.
+
+    Returns:
+        QIcon: The icon.
+    """
+    return QIcon(path)
+
+
+@lru_cache(maxsize=None)
+def load_scaled_pixmap(path, size):
+    """Loads an image scaled to fit a square, which is only decoded and scaled once per run.
+
+    Must be called after the QApplication has been created.
+
+    Args:
+        path (str): The path to the image.
+        size (int): The width and height to fit the image into.
+
+    Returns:
+        QPixmap: The scaled image.
+    """
+    return QPixmap(path).scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
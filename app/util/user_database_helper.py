@@ -166,6 +166,44 @@ class UserDatabaseHelper:
             session.close()
             return all_users
 
+    def load_users(self, authorised=None, limit=None, before_id=None):
+        """Loads the non-admin users, newest first, filtered by authorisation status in the query.
+
+        Args:
+            authorised (bool, optional): If given, only users whose authorised status matches are returned.
+            limit (int, optional): The maximum number of users to return.
+            before_id (int, optional): If given, only users with a lower id are returned, so the next page
+                continues from the last user of the previous one.
+
+        Returns:
+            list: A list of matching user objects.
+        """
+        with self.Session() as session:
+            query = session.query(model.User).filter(model.User.is_admin.is_(False))
+            if authorised is not None:
+                query = query.filter(model.User.is_authorised.is_(authorised))
+            if before_id is not None:
+                query = query.filter(model.User.id < before_id)
+            query = query.order_by(model.User.id.desc())
+            if limit is not None:
+                query = query.limit(limit)
+            users = query.all()
+            session.close()
+            return users
+
+    def set_users_authorised(self, usernames, authorised):
+        """Sets the authorised status of several users in a single transaction.
+
+        Args:
+            usernames (list): The emails of the users to update.
+            authorised (bool): The authorised status to set.
+        """
+        with self.Session() as session:
+            session.query(model.User).filter(model.User.email.in_(usernames)).update(
+                {model.User.is_authorised: authorised}, synchronize_session=False)
+            session.commit()
+            session.close()
+
     def approve_user(self, username):
         """Approves a user by updating their authorization status.
 
@@ -1,7 +1,7 @@
 import os
 import sys
 
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtGui import QPixmap, QPixmapCache
 from PyQt5.QtWidgets import QApplication, QDialog, QSplashScreen
 from PyQt5.QtCore import QSettings, Qt, QTimer
 from app.app_windows.MainWindow import MainWindow
@@ -21,6 +21,8 @@ class MyApp(QApplication):
             argv (list): The list of command line arguments.
         """
         super().__init__(argv)
+        # Shared by the thumbnail grids and the full image popups, in KB.
+        QPixmapCache.setCacheLimit(100 * 1024)
         self.main_window = None
         self.login_window = None
         self.settings = QSettings("YourCompany", "YourApp")